@@ -2,8 +2,9 @@
 import logging
 from .texturing import *  # Import texture handling utilities
 from .default import default  # Import base cell class
+from engine import optics  # Import the pure block model
 
-class xblock(default):
+class xblock(default, optics.xblock):
     """
     Block cell class that completely blocks light from passing through.
     Automatically adapts its visual appearance based on surrounding blocks to create 
@@ -20,11 +21,8 @@ class xblock(default):
             layout: 2D array representing the level layout for neighbor detection
             data: Configuration data (inherited from parent class)
         """
-        # Initialize texture manager
-        self.texture= texturing()
-        
-        # Initialize parent class with all directions as breaking walls (blocks all light)
-        super().__init__(xy= xy, name= name, breaks=[0,1,2,3], data= data)
+        # Initialize the block model (all directions are breaking walls) and the common layers
+        super().__init__(xy= xy, name= name, layout= layout, data= data)
         
         # Analyze surrounding cells to determine appropriate block texture
         sorroundings= []
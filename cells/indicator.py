@@ -1,5 +1,5 @@
 # Import necessary modules for indicator rendering
-from .texturing import multiply  # Import color multiplication utility
+from .texturing import tint  # Import cached color multiplication utility
 from pygame import surface, SRCALPHA  # Import pygame surface handling
 
 # Generate list of number texture file paths (0.png through 10.png)
@@ -42,5 +42,5 @@ def indicatorRender(layer):
 
     # Render the number with color tinting and blit to the final surface
     # Uses the number as index to select appropriate digit texture (0-10)
-    final.blit(multiply(layer["textures"][number], color), blitAt)
+    final.blit(tint(layer["textures"][number], color), blitAt)
     return final
\ No newline at end of file
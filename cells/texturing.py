@@ -1,5 +1,142 @@
 # Import necessary pygame modules for texture manipulation
 from pygame import image, surface, SRCALPHA, transform, BLEND_MULT
+from collections import OrderedDict  # Ordered mapping used as an LRU store
+from collections.abc import Mapping  # Layer states may be mapping views (engine.state) instead of dicts
+
+# Process-wide cache of decoded textures shared by every texturing instance
+class textureCache():
+    def __init__(self):
+        """
+        Initializes an empty cache mapping asset paths to converted surfaces.
+        Hit and miss counters let loaders confirm each asset is decoded only once.
+        """
+        # Dictionary mapping paths relative to 'assets/' to converted surfaces
+        self.surfaces = {}
+
+        # Dictionary mapping tuples of paths to shared, immutable texture sets
+        self.sets = {}
+
+        # Dictionaries mapping tuples of paths to pre-rotated variants (0°, 90°, 180°, 270°)
+        self.rotations = {}
+        self.composites = {}
+
+        # Lookup counters (a miss means the file was read and decoded)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path:str) -> surface.Surface:
+        """
+        Returns the converted surface for an asset, decoding it on first use.
+        The returned surface is shared between all callers and must not be modified.
+
+        Args:
+            path: Texture file path relative to the 'assets/' directory
+
+        Returns:
+            The cached surface converted to alpha format
+        """
+        # Serve already decoded textures straight from memory
+        if path in self.surfaces:
+            self.hits += 1
+            return self.surfaces[path]
+
+        # Decode the file once and convert to alpha format for transparency support
+        self.misses += 1
+        loaded = image.load("assets/" + path).convert_alpha()
+        self.surfaces[path] = loaded
+        return loaded
+
+    def getSet(self, paths) -> tuple[surface.Surface, ...]:
+        """
+        Returns the shared texture set (flyweight) for a list of asset paths.
+        Every layer built from the same paths receives the same tuple, so the
+        number of texture sets grows with the number of cell types, not cells.
+
+        Args:
+            paths: Sequence of texture file paths relative to 'assets/'
+
+        Returns:
+            Immutable tuple of cached surfaces in the same order as the paths
+        """
+        key = tuple(paths)
+        found = self.sets.get(key)
+        if found is None:
+            # First layer with this texture list: build the set from cached surfaces
+            found = tuple(self.get(path) for path in key)
+            self.sets[key] = found
+        return found
+
+    def getRotations(self, paths) -> tuple[tuple[surface.Surface, ...], ...]:
+        """
+        Returns the four rotations of every texture in a set, built once per set.
+        
+        Args:
+            paths: Sequence of texture file paths relative to 'assets/'
+            
+        Returns:
+            Tuple with one entry per texture, each a tuple of its 0°, 90°, 180° and 270° rotations
+        """
+        key = tuple(paths)
+        found = self.rotations.get(key)
+        if found is None:
+            found = tuple(tuple(transform.rotate(img, angle) for angle in (0, 90, 180, 270)) for img in self.getSet(key))
+            self.rotations[key] = found
+        return found
+
+    def getComposites(self, paths) -> tuple[surface.Surface, ...]:
+        """
+        Returns the four rotations of all textures of a set blitted on top of each other.
+        
+        Args:
+            paths: Sequence of texture file paths relative to 'assets/'
+            
+        Returns:
+            Tuple of the composite rotated by 0°, 90°, 180° and 270°
+        """
+        key = tuple(paths)
+        found = self.composites.get(key)
+        if found is None:
+            final = surface.Surface((40,40), SRCALPHA)
+            for img in self.getSet(key):
+                final.blit(img, (0,0))
+            found = tuple(transform.rotate(final, angle) for angle in (0, 90, 180, 270))
+            self.composites[key] = found
+        return found
+
+    def preload(self, paths):
+        """
+        Decodes a batch of textures ahead of time so later lookups are all hits.
+        Paths that are already cached are skipped without touching the counters.
+
+        Args:
+            paths: Iterable of texture file paths relative to 'assets/'
+        """
+        for path in paths:
+            if path not in self.surfaces:
+                self.get(path)
+
+    def clear(self):
+        """
+        Drops every cached surface, texture set and rotation and resets the hit/miss counters.
+        """
+        self.surfaces.clear()
+        self.sets.clear()
+        self.rotations.clear()
+        self.composites.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the current cache counters.
+
+        Returns:
+            Dictionary with 'hits', 'misses' and 'size' (number of cached textures)
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces)}
+
+# Shared cache instance used by all texture layers
+cache = textureCache()
 
 # Utility function for color blending
 def multiply(texture: surface.Surface, color: tuple[int, int, int]) -> surface.Surface:
@@ -22,27 +159,304 @@ def multiply(texture: surface.Surface, color: tuple[int, int, int]) -> surface.S
     
     return result
 
+# Bounded LRU cache of tinted textures shared by every renderer
+class tintCache():
+    def __init__(self, capacity:int=1024):
+        """
+        Initializes an empty tint cache holding at most 'capacity' tinted surfaces.
+        Entries are keyed by (texture identity, color) and evicted least recently used first.
+        """
+        # Ordered mapping (id(texture), color) -> (texture, tinted surface)
+        # The source texture is kept alive so its id cannot be reused while cached
+        self.entries = OrderedDict()
+        self.capacity = capacity
+
+        # Lookup and eviction counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, texture: surface.Surface, color: tuple[int, int, int]) -> surface.Surface:
+        """
+        Returns the texture multiplied by the color, computing it only on a cache miss.
+        The returned surface is shared and read-only: blit from it, never draw on it.
+
+        Args:
+            texture: The source texture surface (should be a long-lived, cached texture)
+            color: RGB color tuple to multiply with the texture
+
+        Returns:
+            The shared tinted surface
+        """
+        key = (id(texture), color)
+        entry = self.entries.get(key)
+        if entry is not None:
+            # Mark as most recently used
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        # Tint once and remember the result
+        self.misses += 1
+        tinted = multiply(texture, color)
+        self.entries[key] = (texture, tinted)
+        self.trim()
+        return tinted
+
+    def trim(self):
+        """
+        Evicts least recently used entries until the cache fits its capacity.
+        """
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, capacity:int):
+        """
+        Changes the maximum number of cached tints, evicting entries if needed.
+
+        Args:
+            capacity: New maximum number of tinted surfaces
+        """
+        self.capacity = capacity
+        self.trim()
+
+    def warm(self, textures, colors):
+        """
+        Pre-computes the tint of every texture with every color so renders only hit the cache.
+        Older entries are evicted first; warming stops once it has filled the whole cache
+        so it never evicts the entries it just added.
+
+        Args:
+            textures: Iterable of source texture surfaces
+            colors: Iterable of RGB color tuples
+        """
+        colors = list(colors)
+        warmed = 0
+        for texture in textures:
+            for color in colors:
+                if warmed >= self.capacity:
+                    return
+                self.get(texture, color)
+                warmed += 1
+
+    def clear(self):
+        """
+        Drops every cached tint and resets the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the current cache counters.
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'evictions', 'size' and 'capacity'
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self.entries), "capacity": self.capacity}
+
+# Shared tint cache instance used by all renderers
+tints = tintCache()
+
+def tint(texture: surface.Surface, color: tuple[int, int, int]) -> surface.Surface:
+    """
+    Memoized version of multiply() backed by the shared tint cache.
+    The result is shared between callers and must not be modified.
+
+    Args:
+        texture: The source texture surface
+        color: RGB color tuple to multiply with the texture
+
+    Returns:
+        The shared tinted surface
+    """
+    return tints.get(texture, color)
+
+def freeze(state):
+    """
+    Converts a (possibly nested) layer state into a hashable snapshot.
+    Used to tell whether a layer really changed since it was last rendered.
+
+    Args:
+        state: Layer state dictionary (values may themselves be dictionaries)
+
+    Returns:
+        Tuple of (key, value) pairs with nested dictionaries frozen as well
+    """
+    return tuple((key, freeze(value) if isinstance(value, Mapping) else value) for key, value in state.items())
+
+# Global cache of rendered cells shared by every texturing instance (hash-consed visuals)
+class spriteCache():
+    def __init__(self, capacity:int=4096):
+        """
+        Initializes an empty sprite cache holding at most 'capacity' composites and
+        'capacity' scaled sprites. Cells with the same visual state signature share
+        one composite and one scaled sprite per size.
+        """
+        # Ordered mappings used as LRU stores
+        self.composites = OrderedDict()  # signature -> 40x40 composite
+        self.sprites = OrderedDict()     # (signature, size) -> scaled composite
+        self.capacity = capacity
+
+        # Signatures seen since the last reset, used to size the cache per level
+        self.seen = set()
+
+        # Lookup counters for composites
+        self.hits = 0
+        self.misses = 0
+
+    def getComposite(self, signature):
+        """
+        Looks up the composite of a visual state signature.
+        
+        Args:
+            signature: Hashable visual state signature built by texturing.render
+            
+        Returns:
+            The shared composite surface, or None if it has not been rendered yet
+        """
+        self.seen.add(signature)
+        found = self.composites.get(signature)
+        if found is None:
+            self.misses += 1
+            return None
+        self.composites.move_to_end(signature)
+        self.hits += 1
+        return found
+
+    def putComposite(self, signature, composite: surface.Surface):
+        """
+        Stores the composite rendered for a visual state signature.
+        
+        Args:
+            signature: Hashable visual state signature
+            composite: The rendered 40x40 surface (becomes shared and read-only)
+        """
+        self.composites[signature] = composite
+        while len(self.composites) > self.capacity:
+            self.composites.popitem(last=False)
+
+    def getScaled(self, signature, composite: surface.Surface, size:tuple[int, int]) -> surface.Surface:
+        """
+        Returns the composite of a signature scaled to a size, scaling only on a miss.
+        
+        Args:
+            signature: Hashable visual state signature
+            composite: The composite for that signature (used on a miss)
+            size: Target (width, height)
+            
+        Returns:
+            The shared scaled surface
+        """
+        key = (signature, size)
+        found = self.sprites.get(key)
+        if found is None:
+            found = transform.scale(composite, size)
+            self.sprites[key] = found
+            while len(self.sprites) > self.capacity:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(key)
+        return found
+
+    def retain(self, *sizes:tuple[int, int]):
+        """
+        Drops every scaled sprite whose size is not in 'sizes' (used when the cell size changes).
+        
+        Args:
+            *sizes: Sizes that are still in use
+        """
+        for key in [key for key in self.sprites if key[1] not in sizes]:
+            del self.sprites[key]
+
+    def distinct(self) -> int:
+        """
+        Returns how many distinct visual state signatures were seen since the last reset.
+        """
+        return len(self.seen)
+
+    def resetStats(self):
+        """
+        Resets the counters and the set of seen signatures (e.g. when a level is loaded).
+        """
+        self.seen.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """
+        Drops every cached composite and sprite and resets the counters.
+        """
+        self.composites.clear()
+        self.sprites.clear()
+        self.resetStats()
+
+    def stats(self) -> dict:
+        """
+        Returns the current cache counters.
+        
+        Returns:
+            Dictionary with 'hits', 'misses', 'distinct', 'composites', 'sprites' and 'capacity'
+        """
+        return {"hits": self.hits, "misses": self.misses, "distinct": self.distinct(), "composites": len(self.composites), "sprites": len(self.sprites), "capacity": self.capacity}
+
+# Shared sprite cache instance used by all texturing instances
+sprites = spriteCache()
+
+def rendererName(renderer) -> str:
+    """
+    Returns a stable name for a layer renderer (bound methods resolve to their function).
+    """
+    return getattr(renderer, "__func__", renderer).__qualname__
+
 # Main texturing class for managing layered texture rendering
 class texturing():
-    def __init__(self):
+    def __init__(self, kind:str=""):
         """
         Initializes the texturing system with empty layer containers.
         Layers allow for composited rendering of multiple texture elements.
+        
+        Args:
+            kind: Name of the owning cell class, part of the visual state signature
         """
+        # Owner cell class name, so different cell types never share a sprite
+        self.kind = kind
+
         # Dictionary to store layer data (textures, renderers, states)
         self.layers = {}
         
         # Dictionary to map layer names to layer indices for easy access
         self.referencer = {}
 
+        # Layer indices in drawing order (kept sorted as layers are added)
+        self.order = []
+
+        # Render cache: last surface and state snapshot of every layer, plus the composite
+        self.rendered = {}
+        self.snapshots = {}
+        self.composite = None
+
+        # Layer indices whose state may have changed since the last render
+        self.dirty = set()
+
+        # Layer indices whose snapshot changed but whose surface was not re-rendered
+        # (the composite came from the shared sprite cache instead)
+        self.stale = set()
+
+        # Visual state signature of the current composite, the key into the shared sprite cache
+        self.signature = None
+
     # Static method for default texture rendering with rotation support
     def defaultRender(layer:dict):
         """
         Default renderer that returns the texture based on the current layer state.
-        Handles texture selection by index and applies rotation based on direction.
+        Handles texture selection by index and picks the pre-rotated variant for the direction.
         
         Args:
-            layer: Dictionary containing 'textures', 'state', and 'renderer' keys
+            layer: Dictionary containing 'textures', 'rotated', 'composites', 'state', and 'renderer' keys
                 state: {'index': int, 'direction': int}
                     - index: -1 = composite all textures, None = transparent, >=0 = specific texture
                     - direction: 0-3 representing 0°, 90°, 180°, 270° rotation
@@ -54,24 +468,16 @@ class texturing():
         if "direction" not in layer["state"]:
             layer["state"]["direction"] = 0
             
-        # Handle special case: composite all textures (index = -1)
+        # Handle special case: composite all textures (index = -1), pre-rotated per direction
         if layer["state"]["index"] == -1:
-            # Create transparent surface for compositing
-            final = surface.Surface((40,40), SRCALPHA)
-            
-            # Blit all textures on top of each other
-            for img in layer["textures"]:
-                final.blit(img, (0,0))
-                
-            # Apply rotation based on direction (0°, 90°, 180°, 270°)
-            return transform.rotate(final, [0,90,180,270][layer["state"]["direction"]])
+            return layer["composites"][layer["state"]["direction"]]
             
         # Handle transparent/empty case (index = None)
         elif layer["state"]["index"] == None:
             return surface.Surface((40,40), SRCALPHA)
             
-        # Handle normal case: render specific texture by index with rotation
-        return transform.rotate(layer["textures"][layer["state"]["index"]], [0,90,180,270][layer["state"]["direction"]])
+        # Handle normal case: look up the specific texture already rotated to the direction
+        return layer["rotated"][layer["state"]["index"]][layer["state"]["direction"]]
 
     # Method to create and register a new texture layer
     def newLayer(self, layer:int, name:str, textures:list[str], renderer:callable=defaultRender, state:dict=None):
@@ -81,26 +487,35 @@ class texturing():
         Args:
             layer: Layer index (0 = cell, 1-2 = beams, higher numbers for additional elements)
             name: String identifier for easy layer access
-            textures: List of texture file paths relative to 'assets/' directory
+            textures: List of texture file paths relative to 'assets/' directory (shared as one texture set)
             renderer: Function to render this layer (defaults to defaultRender)
             state: Initial state dictionary (defaults to index=0, direction=0)
         """
         # Set default state if none provided
         if state is None:
             state = {"index": 0, "direction": 0}
+
+        # Fill in the default direction up front so the state snapshot is complete
+        if renderer is texturing.defaultRender and "direction" not in state:
+            state["direction"] = 0
         
-        # Load all texture files from the assets directory
-        loaded = []
-        for texture in textures:
-            # Convert to alpha format for transparency support
-            loaded.append(image.load("assets/" + texture).convert_alpha())
+        # Reuse the shared texture set for these files (decoded once per process)
+        loaded = cache.getSet(textures)
 
-        # Store layer configuration in layers dictionary
-        self.layers[layer] = {"textures": loaded, "renderer": renderer, "state": state}
+        # Store layer configuration in layers dictionary (only the state is per instance)
+        # Rotated variants are shared per texture set so a rotation is just a lookup
+        self.layers[layer] = {"textures": loaded, "rotated": cache.getRotations(textures), "composites": cache.getComposites(textures), "renderer": renderer, "state": state,
+                              "key": (tuple(textures), rendererName(renderer))}
         
         # Create name-to-layer mapping for easy access
         self.referencer[name] = layer
 
+        # Keep a stable, sorted drawing order and force the new layer to render
+        self.order = sorted(self.layers)
+        self.snapshots.pop(layer, None)
+        self.rendered.pop(layer, None)
+        self.dirty.add(layer)
+
     # Method to safely retrieve layer state information
     def getState(self, name):
         """
@@ -133,27 +548,98 @@ class texturing():
                 print(f"Error: State '{state}' not found in layer '{name}'")
                 return
                 
-            # Apply the state change to the layer
-            self.layers[self.referencer[name]]["state"][state] = value
+            # Apply the state change to the layer, marking it dirty only if the value differs
+            layerState = self.layers[self.referencer[name]]["state"]
+            if layerState[state] != value:
+                layerState[state] = value
+                self.dirty.add(self.referencer[name])
+
+    # Method to flag layers whose state was changed in place (outside of update)
+    def touch(self, *names):
+        """
+        Marks layers as dirty after their shared state dictionary was modified directly.
+        Names without a layer yet are skipped (newLayer always renders a new layer).
+        
+        Args:
+            *names: String identifiers of the layers to mark
+        """
+        for name in names:
+            if name in self.referencer:
+                self.dirty.add(self.referencer[name])
 
     # Method to render all layers into a final composite image
     def render(self):
         """
         Renders all layers in order to create the final composite texture.
-        Each layer is rendered using its associated renderer function and blitted onto the final surface.
+        When nothing changed since the last call the previous composite is returned.
+        Otherwise the visual state signature (cell kind plus every layer's textures,
+        renderer and state) is looked up in the shared sprite cache, and only on a miss
+        are the changed layers re-rendered and composited.
         
         Returns:
-            A 40x40 surface containing the composite of all active layers
+            A 40x40 surface containing the composite of all active layers.
+            The surface is cached and shared, callers must not draw on it.
         """
+        # Find dirty layers whose state differs from the last snapshot
+        changed = self.composite is None
+        for layer_index in self.dirty:
+            snapshot = freeze(self.layers[layer_index]["state"])
+            if self.snapshots.get(layer_index) != snapshot:
+                self.snapshots[layer_index] = snapshot
+                self.stale.add(layer_index)
+                changed = True
+        self.dirty.clear()
+
+        # Nothing changed: reuse the previous composite
+        if not changed:
+            return self.composite
+
+        # Identical cells share one composite through the sprite cache
+        self.signature = (self.kind,) + tuple((layer_index, self.layers[layer_index]["key"], self.snapshots[layer_index]) for layer_index in self.order)
+        found = sprites.getComposite(self.signature)
+        if found is not None:
+            self.composite = found
+            return found
+
+        # Re-render only the layers whose state changed
+        for layer_index in self.stale:
+            layer = self.layers[layer_index]
+            self.rendered[layer_index] = layer["renderer"](layer)
+        self.stale.clear()
+
         # Create the base transparent surface for the final composite
         finalRender = surface.Surface((40,40), SRCALPHA)
         
-        # Render each layer in order and composite them together
-        for layer_index in set(self.layers.keys()):
-            # Get the rendered layer surface using the layer's renderer function
-            layer_surface = self.layers[layer_index]["renderer"](self.layers[layer_index])
+        # Composite the cached layer surfaces in their stable drawing order
+        for layer_index in self.order:
+            finalRender.blit(self.rendered[layer_index], (0, 0))
+
+        self.composite = finalRender
+        sprites.putComposite(self.signature, finalRender)
+        return finalRender
+
+    # Method to get the composite scaled to a target size from the shared sprite cache
+    def scaled(self, size:tuple[int, int]):
+        """
+        Returns the composite scaled to the requested size, scaling only when no cell
+        with the same visual state has been drawn at that size yet.
+        
+        Args:
+            size: Target (width, height) of the sprite
             
-            # Blit the layer onto the final composite surface
-            finalRender.blit(layer_surface, (0, 0))
+        Returns:
+            The scaled surface (shared, callers must not draw on it)
+        """
+        composite = self.render()
+        return sprites.getScaled(self.signature, composite, size)
 
-        return finalRender
\ No newline at end of file
+    # Method to prepare the scaled sprites of the current state for a set of sizes
+    def rebuild(self, *sizes:tuple[int, int]):
+        """
+        Pre-scales the current composite to every requested size.
+        
+        Args:
+            *sizes: Target (width, height) sizes that should be ready in the sprite cache
+        """
+        for size in sizes:
+            self.scaled(size)
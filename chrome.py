@@ -0,0 +1,138 @@
+# Window chrome: the surfaces drawn around the board that only depend on the window and level size,
+# built once and kept in small caches so redraws after a resize, pause or level switch are plain blits
+from collections import OrderedDict  # Ordered mapping used as an LRU store
+import numpy as np  # Import numpy to build the gradient in one pass
+import pygame
+
+# Color at the center of the background gradient
+gradientColor= np.array([0, 175, 185], dtype=np.float64)
+
+def gradient(size:tuple[int, int], inner:int) -> pygame.Surface:
+    """
+    Build the background gradient: full color in the middle, fading out towards the corners.
+
+    Args:
+        size: (width, height) of the window
+        inner: Smallest side of the play area, the fade is scaled to it
+
+    Returns:
+        A new surface of the window size
+    """
+    width, height = size
+    centerX, centerY = width // 2, height // 2
+    maxDist = np.sqrt(centerX**2 + centerY**2)
+    # Distances of every pixel, indexed [x, y] like pygame's surfarray (broadcast, no meshgrid)
+    dx = np.arange(width, dtype=np.float64)[:, None] - centerX
+    dy = np.arange(height, dtype=np.float64)[None, :] - centerY
+    dist = np.clip(1 - np.sqrt(dx**2 + dy**2) / maxDist, 0, 1)
+    # Adjust falloff so center is near full color
+    falloff = np.clip(1 - (dist * (max(centerX, centerY) / (inner / 1.5))) * 0.5, 0, 1)
+    # All three channels in one uint8 pass
+    built = pygame.surfarray.make_surface((falloff[:, :, None] * gradientColor).astype(np.uint8))
+    # In the display's pixel format when there is one, so blitting it needs no conversion
+    return built.convert() if pygame.display.get_surface() is not None else built
+
+def frame(side:pygame.Surface, corner:pygame.Surface, size:tuple[int, int]) -> tuple:
+    """
+    Build the border around the play area as four edge strips and four corners.
+    The side tile is repeated along each strip once here, so drawing the border is eight blits
+    (see LightHackGame.makeBorder()). Strips are exact copies of the tiles (tiles never overlap), so the border
+    looks the same as blitting every tile on the window.
+
+    Args:
+        side: Side tile (16 wide, top side orientation)
+        corner: Corner tile (top-left orientation)
+        size: (min_width, min_height) of the play area, border included
+
+    Returns:
+        Tuple of (surface, (x, y)) pieces, positioned relative to the play area offset and in drawing order
+    """
+    width, height = size
+    tileW, tileH = side.get_size()
+    cornerW, cornerH = corner.get_size()
+    # Tiles along the top and bottom, and along the left and right
+    across, down = width // tileW - 3, height // tileW - 3
+
+    def strip(tile, count, vertical):
+        # Zeroed alpha surface, tiles copied in with their exact pixels (max over 0)
+        w, h = tile.get_size()
+        built = pygame.Surface((w, h * count) if vertical else (w * count, h), pygame.SRCALPHA)
+        for i in range(count):
+            built.blit(tile, (0, i * h) if vertical else (i * w, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return built
+
+    return (
+        (strip(side, across, False), (0, -tileH)),  # Top side
+        (strip(pygame.transform.rotate(side, 180), across, False), (0, height - 2 * tileH)),  # Bottom side
+        (strip(pygame.transform.rotate(side, 90), down, True), (-tileH, 0)),  # Left side
+        (strip(pygame.transform.rotate(side, 270), down, True), (width - 2 * tileH, 0)),  # Right side
+        (corner, (-cornerW, -cornerH)),  # Top-left
+        (pygame.transform.rotate(corner, 270), (width - 2 * cornerW, -cornerH)),  # Top-right
+        (pygame.transform.rotate(corner, 90), (-cornerW, height - 2 * cornerH)),  # Bottom-left
+        (pygame.transform.rotate(corner, 180), (width - 2 * cornerW, height - 2 * cornerH)),  # Bottom-right
+    )
+
+class chromeCache():
+    def __init__(self, build, capacity:int=4):
+        """
+        Initializes an empty cache of the surfaces 'build' makes, holding at most 'capacity' entries.
+        Entries are keyed by the arguments of get() and evicted least recently used first.
+
+        Args:
+            build: Function making the cached value from the arguments of get()
+            capacity: Maximum number of cached values
+        """
+        # Ordered mapping arguments -> built value
+        self.build = build
+        self.entries = OrderedDict()
+        self.capacity = capacity
+
+        # Lookup counters
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, *args):
+        """
+        Returns the value built for the arguments, building it only on a cache miss.
+        Returned surfaces are shared and read-only: blit from them, never draw on them.
+
+        Args:
+            *args: Arguments of the build function (hashable)
+
+        Returns:
+            The shared built value
+        """
+        found = self.entries.get(args)
+        if found is not None:
+            # Mark as most recently used
+            self.entries.move_to_end(args)
+            self.hits += 1
+            return found
+
+        self.misses += 1
+        found = self.entries[args] = self.build(*args)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return found
+
+    def clear(self):
+        """
+        Drops every cached value and resets the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the current cache counters.
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'size' and 'capacity'
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "capacity": self.capacity}
+
+# Shared caches (the menu and every level share window sizes): gradients keyed by
+# (window size, inner size), border frames by (side tile, corner tile, play area size)
+gradients = chromeCache(gradient)
+frames = chromeCache(frame)
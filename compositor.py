@@ -0,0 +1,99 @@
+# Layered window compositor: the static chrome is painted once into an off-screen surface and
+# everything above it is kept as layers of sprites, so a change only recomposites the rectangles
+# it touched, from the cached layers, instead of replaying every draw call into the window
+import pygame
+
+class compositor():
+    """
+    Off-screen composition of the game window.
+    The bottom layer is the static chrome (an opaque window-size surface: gradient, border,
+    cell backgrounds...). Above it, named layers hold sprites keyed by the caller (e.g. a grid
+    position), drawn in layer order and, within a layer, in the order they were first put.
+    Putting or removing a sprite marks its rectangles dirty; compose() rebuilds only those.
+    """
+
+    def __init__(self, order:tuple):
+        """
+        Args:
+            order: Names of the layers above the chrome, bottom to top (the game's layerOrder)
+        """
+        # Static chrome surface (None draws nothing under the layers)
+        self.chrome = None
+        # Layer name -> {key: (surface, window rect)}
+        self.layers = {name: {} for name in order}
+        # Window rectangles to recomposite, and whether the whole window has to be
+        self.dirty = []
+        self.full = True
+
+    def setChrome(self, chrome:pygame.Surface):
+        """Replace the static chrome (after a resize or load), the whole window is recomposited."""
+        self.chrome = chrome
+        self.full = True
+
+    def put(self, layer:str, key, image:pygame.Surface, position):
+        """
+        Place a sprite in a layer, replacing the one under the same key.
+
+        Args:
+            layer: Layer name
+            key: Identifier of the sprite within the layer
+            image: Surface to draw (shared sprites are fine, it is never drawn on)
+            position: Window position of its top-left corner
+        """
+        items = self.layers[layer]
+        rect = image.get_rect(topleft=position)
+        old = items.get(key)
+        if old is not None:
+            # Same sprite in the same place, nothing to redraw
+            if old[0] is image and old[1] == rect:
+                return
+            self.dirty.append(old[1])
+        items[key] = (image, rect)
+        self.dirty.append(rect)
+
+    def remove(self, layer:str, key):
+        """Take a sprite out of a layer (nothing happens if it is not there)."""
+        old = self.layers[layer].pop(key, None)
+        if old is not None:
+            self.dirty.append(old[1])
+
+    def clear(self, layer:str):
+        """Take every sprite out of a layer."""
+        self.dirty.extend(rect for image, rect in self.layers[layer].values())
+        self.layers[layer].clear()
+
+    def invalidate(self, rect=None):
+        """Mark a window rectangle for recomposition (the whole window if None, e.g. after the pause menu drew over it)."""
+        if rect is None:
+            self.full = True
+        else:
+            self.dirty.append(pygame.Rect(rect))
+
+    def compose(self, target:pygame.Surface) -> list|None:
+        """
+        Rebuild the dirty parts of the window from the chrome and the layers.
+
+        Args:
+            target: Window surface to draw into
+
+        Returns:
+            The rectangles that were rebuilt, or None if the whole window was
+        """
+        full = self.full
+        if full:
+            rects = [target.get_rect()]
+        else:
+            # The same rectangle is often marked twice (old and new sprite in place), rebuild it once
+            rects = list({tuple(rect): rect for rect in self.dirty}.values())
+        for rect in rects:
+            target.set_clip(rect)
+            if self.chrome is not None:
+                target.blit(self.chrome, rect, rect)
+            for items in self.layers.values():
+                for image, where in items.values():
+                    if where.colliderect(rect):
+                        target.blit(image, where)
+        target.set_clip(None)
+        self.dirty = []
+        self.full = False
+        return None if full else rects
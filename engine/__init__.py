@@ -0,0 +1,6 @@
+# Headless simulation engine for LightHack
+# Pure-data cell models and beam propagation, with no pygame dependency, so levels
+# can be validated, solved and benchmarked on machines without a display
+
+from .optics import models, kinds  # Pure cell models keyed by level cell type name and their type codes
+from .board import board, result  # Grid model with beam propagation and its run result
@@ -0,0 +1,623 @@
+# Headless light simulation: grid model, beam propagation and final-cell evaluation
+import logging
+import numpy as np          # Import numpy for bulk queries over the state arrays
+from .optics import models, kinds  # Import pure cell models for boards built from level data and their type codes
+from .state import grid     # Import the array-backed cell state
+from . import fixedpoint     # Import the fixed-point solver used by the "fixed" solver mode
+from . import superposition  # Import the per-source tracer used by the "superposed" solver mode
+from . import rgb            # Import packed colors (superposed contributions are kept packed)
+
+class result():
+    """
+    Outcome of one simulation run on a board.
+    """
+
+    def __init__(self, changed:list[tuple[int, int]], finals:list, completed:bool, steps:int=0, exhausted:bool=False, iterations:int=0, cycle:int=0):
+        """
+        Args:
+            changed: Grid positions (x, y) whose visual state differs from the previous run
+            finals: Final cells found on the board
+            completed: True if every final cell is completed (and there is at least one)
+            steps: Number of cell interactions (changeLight calls) the run took
+            exhausted: True if the run hit the board's step budget and was cut short
+            iterations: Whole-board iterations the fixed-point solver needed (0 in trace mode)
+            cycle: Length of the light loop the fixed-point solver settled (0 if none)
+        """
+        self.changed = changed
+        self.finals = finals
+        self.completed = completed
+        self.steps = steps
+        self.exhausted = exhausted
+        self.iterations = iterations
+        self.cycle = cycle
+
+    def __repr__(self):
+        return f"result(changed={len(self.changed)}, finals={len(self.finals)}, completed={self.completed}, steps={self.steps}, exhausted={self.exhausted}, iterations={self.iterations}, cycle={self.cycle})"
+
+class board():
+    """
+    Grid of cell models plus the beam propagation that lights them.
+    Works on any objects following the engine.optics interface, so the same board
+    drives the drawable cells of the game and pure models on machines with no display.
+    Beams are propagated with an explicit stack of beam fronts instead of recursion,
+    so dense layouts cannot hit the interpreter recursion limit.
+    """
+
+    # Default maximum number of cell interactions in one simulation run
+    # (normal levels need a few hundred, light caught in a loop stops here)
+    budget= 100000
+
+    # How simulate() lights the board by default:
+    # "trace" follows every beam from the lasers in row order (loops are cut by the prism heuristic),
+    # "fixed" iterates all cells to a fixed point with cycle detection (independent of laser order),
+    # "superposed" traces every source on its own and adds the light up where it meets,
+    # keeping each source's contribution so an edit only retraces the sources it touches
+    solver= "trace"
+
+    # Debug switch: cross-check every incremental update against a full recalculation
+    # (logs the positions that differ, the full result is kept)
+    verify= False
+
+    def __init__(self, layout:list[list], budget:int|None=None, solver:str|None=None):
+        """
+        Args:
+            layout: 2D list of cells indexed [y][x]. The list is shared, not copied,
+                    so cells replaced in it by the game are seen by the board.
+            budget: Maximum cell interactions per run (class default if None)
+            solver: Default solver mode, "trace", "fixed" or "superposed" (class default if None)
+        """
+        self.layout = layout
+        self.height = len(layout)
+        self.width = len(layout[0]) if layout else 0
+
+        # Step budget and the counters of the current run
+        if budget is not None:
+            self.budget = budget
+        if solver is not None:
+            self.solver = solver
+        self.steps = 0
+        self.exhausted = False
+
+        # Positions every fired source's light reached in the last trace run, keyed by source
+        # (None until a trace run happened), and the sources that run fired (None for every laser)
+        self.traces = None
+        self.fired = None
+        # Solver mode of the last run (None until a run happened), kept by update() when it falls back to a full run
+        self.solved = None
+
+        # Light each source sends into every side on its own: source -> {(x, y) -> four packed colors}
+        # (None unless the last run was superposed, see engine.superposition)
+        self.contributions = None
+
+        # Beam-path index of trace and superposed runs: (x, y) -> four lists (one per entry side) of
+        # (source, color) segments, the light each source sends into that side of the cell
+        self.paths = {}
+
+        # Ray-skip index: skips[Dir][y][x] is (x, y, run) of the next non-empty cell seen
+        # from (x, y) going in Dir, with the number of empty cells in between
+        # (x and y are None if the light leaves the grid after the run)
+        self.skips = [[[None] * self.width for _ in range(self.height)] for Dir in range(4)]
+
+        # State of every cell in typed arrays, the cells read and write it through views
+        self.state = grid(self.width, self.height)
+        self.sync()
+
+        # Last known visual state of every position, used to report what needs redrawing
+        self.visuals = {}
+        # Final cells not completed, kept up to date by changes() (see completed())
+        self.unfinished = set()
+        self.changes()
+
+    @classmethod
+    def fromLevel(cls, levelData:dict, registry:dict=models, budget:int|None=None):
+        """
+        Build a board from level data (the contents of a levels/*.json file).
+
+        Args:
+            levelData: Dictionary with "layout" (cell IDs) and "cells" (type and data per ID)
+            registry: Mapping of cell type names to classes (pure models by default)
+            budget: Maximum cell interactions per run (class default if None)
+
+        Returns:
+            A new board holding one cell per layout entry
+        """
+        layout = []
+        for y, row in enumerate(levelData["layout"]):
+            layout.append([])
+            for x, cell in enumerate(row):
+                layout[y].append(registry[levelData["cells"][cell]["type"]](xy=(x, y), name=cell, layout=levelData["layout"], data=levelData["cells"][cell]["data"]))
+        return cls(layout, budget)
+
+    def positions(self):
+        """Iterate over every (x, y) position of the grid in row order."""
+        for y in range(self.height):
+            for x in range(self.width):
+                yield x, y
+
+    def index(self, *positions:tuple[int, int]):
+        """
+        Build the ray-skip index for the rows and columns through positions
+        (the whole grid if none), after cells there were placed or removed.
+        """
+        rows = range(self.height) if not positions else {y for x, y in positions}
+        columns = range(self.width) if not positions else {x for x, y in positions}
+        for y in rows:
+            self.sweep(1, y)
+            self.sweep(3, y)
+        for x in columns:
+            self.sweep(0, x)
+            self.sweep(2, x)
+
+    def sync(self):
+        """
+        Pick up cells placed in the layout since the last run (e.g. by convert()):
+        bind them to the board's state arrays and update the ray-skip index around them.
+        """
+        moved = [(x, y) for x, y in self.positions() if self.layout[y][x].slot.grid is not self.state]
+        for x, y in moved:
+            self.layout[y][x].bind(self.state, x, y)
+        if moved:
+            self.index(*moved)
+
+    def sweep(self, Dir:int, line:int):
+        """
+        Rebuild the ray-skip entries of one row (Dir 1 or 3) or column (Dir 0 or 2),
+        walking against the direction of travel so every cell can reuse its neighbour's entry.
+        """
+        dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
+        if dy == 0:
+            line = [(x, line) for x in range(self.width)]
+        else:
+            line = [(line, y) for y in range(self.height)]
+        if dx + dy > 0:
+            line.reverse()
+        skips = self.skips[Dir]
+        for x, y in line:
+            nextX, nextY = x + dx, y + dy
+            if nextX < 0 or nextY < 0 or nextX >= self.width or nextY >= self.height:
+                # Light leaves the grid right away
+                skips[y][x] = (None, None, 0)
+            elif self.layout[nextY][nextX].code != kinds.empty:
+                # Next cell is an optical element
+                skips[y][x] = (nextX, nextY, 0)
+            else:
+                # Next cell is empty, the run continues up to where the neighbour's ends
+                landX, landY, run = skips[nextY][nextX]
+                skips[y][x] = (landX, landY, run + 1)
+
+    def restart(self):
+        """
+        Reset every cell to its unlit state. The state arrays are cleared at once,
+        only cells that were lit or keep other light state are notified.
+        """
+        notify = self.state.lit() | self.state.keeps
+        self.state.reset()
+        for y, x in np.argwhere(notify):
+            self.layout[y][x].cleared()
+
+    def emit(self, x:int, y:int, visited:set|None=None) -> set:
+        """
+        Fire the light source at (x, y) and propagate its beams.
+
+        Args:
+            x, y: Grid position of the source
+            visited: Optional set collecting every position the light reached
+
+        Returns:
+            The set of visited positions
+        """
+        if visited is None:
+            visited = set()
+        if not self.step():
+            return visited
+        newLights, rtrn = self.layout[y][x].changeLight()
+        visited.add((x, y))
+        # Cast beams from the source if it emits light
+        if rtrn is not True:
+            self.propagate(self.fronts(x, y, newLights), visited, (x, y))
+        return visited
+
+    def beam(self, startX:int, startY:int, Dir:int, color:tuple, visited:set|None=None) -> set:
+        """
+        Cast a light beam from starting position in specified direction.
+        The beam continues until it hits a non-empty cell or goes out of bounds,
+        and every beam that cell sends out is followed the same way.
+
+        Args:
+            startX, startY: Grid position the beam leaves from
+            Dir: Direction of travel (0=up, 1=right, 2=down, 3=left)
+            color: RGB color (game scale) of the beam
+            visited: Optional set collecting every position the light reached
+
+        Returns:
+            The set of visited positions (steps count towards the current run's budget,
+            which simulate() resets)
+        """
+        if visited is None:
+            visited = set()
+        self.propagate([(startX, startY, Dir, color)], visited, (startX, startY))
+        return visited
+
+    def fronts(self, x:int, y:int, newLights:dict) -> list[tuple]:
+        """
+        Turn the beams a cell sends out into stack entries.
+        They are pushed in reverse so the first beam is popped (followed) first,
+        which visits cells in exactly the order of a depth-first recursion.
+        """
+        return [(x, y, Dir, color) for Dir, color in reversed(newLights.items())]
+
+    def step(self, count:int=1) -> bool:
+        """
+        Count cell interactions against the budget.
+
+        Args:
+            count: Number of interactions (a whole run of empty cells is counted at once)
+
+        Returns:
+            False once the budget is spent (the run is then marked as exhausted)
+        """
+        if self.steps + count > self.budget:
+            if not self.exhausted:
+                logging.warning(f"Light simulation stopped after {self.steps} steps (step budget reached)")
+            self.exhausted = True
+            return False
+        self.steps += count
+        return True
+
+    def propagate(self, stack:list[tuple], visited:set, source:tuple[int, int]|None=None):
+        """
+        Follow beam fronts until none are left (or the step budget runs out).
+
+        Args:
+            stack: Beam fronts (x, y, direction, color), the last one is followed first
+            visited: Set collecting every position the light reached
+            source: Position of the source the light comes from, recorded in the beam-path index
+        """
+        while stack:
+            startX, startY, Dir, color = stack.pop()
+            From = [2, 3, 0, 1][Dir]
+            # Jump over the run of empty cells ('D' type) to the next optical element
+            x, y, run = self.skips[Dir][startY][startX]
+
+            # Light up the whole run of empty cells in one batch
+            if run:
+                if not self.step(run):
+                    return
+                self.paint(startX, startY, Dir, run, color, visited, source)
+            # Beam went out of bounds
+            if x is None:
+                continue
+
+            # Handle interaction with non-empty cell
+            if not self.step():
+                return
+            newLights, rtrn = self.layout[y][x].changeLight(From=From, color=color)
+            visited.add((x, y))
+            self.record(x, y, From, color, source)
+            # If cell doesn't absorb the light, follow its new beams next
+            if not rtrn:
+                stack.extend(self.fronts(x, y, newLights))
+
+    def paint(self, startX:int, startY:int, Dir:int, run:int, color:tuple, visited:set, source:tuple[int, int]|None):
+        """
+        Apply a beam to a run of empty cells.
+
+        Args:
+            startX, startY: Grid position the beam leaves from (not part of the run)
+            Dir: Direction of travel (0=up, 1=right, 2=down, 3=left)
+            run: Number of empty cells the beam crosses
+            color: RGB color (game scale) of the beam
+            visited: Set collecting every position the light reached
+            source: Position of the source the light comes from
+        """
+        # Calculate direction vectors: Up=0, Right=1, Down=2, Left=3
+        dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
+        From = [2, 3, 0, 1][Dir]
+        for k in range(1, run + 1):
+            x, y = startX + dx * k, startY + dy * k
+            self.layout[y][x].changeLight(From=From, color=color)
+            visited.add((x, y))
+            self.paths.setdefault((x, y), ([], [], [], []))[From].append((source, color))
+
+    def record(self, x:int, y:int, From:int, color:tuple, source:tuple[int, int]|None):
+        """Add a segment of light entering side 'From' of (x, y) to the beam-path index."""
+        self.paths.setdefault((x, y), ([], [], [], []))[From].append((source, color))
+
+    def feeds(self, x:int, y:int, From:int|None=None) -> list[tuple]:
+        """
+        Answer "what feeds this cell" from the beam-path index of the last trace run.
+
+        Args:
+            x, y: Grid position of the cell
+            From: Only report light entering this side (every side if None)
+
+        Returns:
+            List of (source, entry side, color) segments, in the order the light arrived
+        """
+        sides = self.paths.get((x, y), ([], [], [], []))
+        return [(source, side, color) for side in (range(4) if From is None else [From]) for source, color in sides[side]]
+
+    def sources(self) -> list[tuple[int, int]]:
+        """Positions of every laser (and level selector), in row order (from the emitter registry)."""
+        return self.state.inRows(self.state.emitters)
+
+    def finals(self) -> list:
+        """Final cells currently on the board, in row order (from the goal registry)."""
+        return [self.layout[y][x] for x, y in self.state.inRows(self.state.goals)]
+
+    def completed(self) -> bool:
+        """
+        Incremental win check: True if there is at least one final cell and every final cell
+        is completed. The set of unfinished finals is updated by changes() from the positions
+        whose look changed: a final's completion is part of its visual state, so only finals
+        whose input changed in the last run (or that were placed or removed) are looked at again.
+        """
+        return bool(self.state.goals) and not self.unfinished
+
+    def settle(self, sources:list[tuple[int, int]]) -> fixedpoint.solution:
+        """
+        Light the board with the fixed-point solver: solve the light entering every side,
+        then hand each cell its final inputs (the board must have been restarted).
+
+        Args:
+            sources: Positions to fire as light sources
+
+        Returns:
+            The solver's solution (iteration count and detected loop length)
+        """
+        solution = fixedpoint.solve(self, sources)
+        sources = set(sources)
+        dark = [(0, 0, 0)] * 4
+        for x, y in self.positions():
+            if (x, y) in solution.inputs or (x, y) in sources:
+                self.layout[y][x].settle(solution.inputs.get((x, y), dark), (x, y) in sources)
+        return solution
+
+    def contribute(self, source:tuple[int, int]):
+        """
+        Trace one source on its own (see engine.superposition.trace) and keep its contribution,
+        the positions it reached and its segments in the beam-path index.
+        """
+        arrivals = superposition.trace(self, *source)
+        self.contributions[source] = arrivals
+        self.traces[source] = set(arrivals) | {source}
+        for position, sides in arrivals.items():
+            segments = self.paths.setdefault(position, ([], [], [], []))
+            for From in range(4):
+                if sides[From]:
+                    # Segments are kept in the row order of their sources, as a full run adds them
+                    segments[From].append((source, rgb.channels[sides[From]]))
+                    segments[From].sort(key=lambda segment: (segment[0][1], segment[0][0]))
+
+    def withdraw(self, source:tuple[int, int]) -> set:
+        """
+        Forget the contribution of a source (before it is traced again or once it is gone).
+
+        Returns:
+            The positions its light reached
+        """
+        reached = self.traces.pop(source)
+        del self.contributions[source]
+        for position in reached:
+            segments = self.paths.get(position)
+            if segments is not None:
+                for From in range(4):
+                    segments[From][:] = [segment for segment in segments[From] if segment[0] != source]
+                if not any(segments):
+                    del self.paths[position]
+        return reached
+
+    def superpose(self, positions, sources:list[tuple[int, int]]):
+        """
+        Hand the cells at positions the summed light of every source reaching them
+        (the cells must have been restarted).
+
+        Args:
+            positions: Positions to light
+            sources: Positions fired as light sources
+        """
+        fired = set(sources)
+        for x, y in positions:
+            segments = self.paths.get((x, y))
+            reaching = {source for side in segments for source, color in side} if segments else ()
+            if reaching or (x, y) in fired:
+                total = superposition.combine([self.contributions[source][(x, y)] for source in reaching])
+                self.layout[y][x].settle([rgb.channels[color] for color in total], (x, y) in fired)
+
+    def simulate(self, sources:list[tuple[int, int]]|None=None, solver:str|None=None) -> result:
+        """
+        Recalculate all light on the board: reset every cell, then fire the sources.
+
+        Args:
+            sources: Positions to fire, in order (every laser by default)
+            solver: "trace", "fixed" or "superposed" (the board's default if None)
+
+        Returns:
+            A result with the positions whose visual state changed and the final-cell status
+        """
+        # Cells may have been placed or removed since the last run
+        self.sync()
+        self.restart()
+        self.steps = 0
+        self.exhausted = False
+        self.fired = None if sources is None else list(sources)
+        sources = self.sources() if sources is None else sources
+        iterations, cycle = 0, 0
+        solver = self.solver if solver is None else solver
+        self.solved = solver
+        self.contributions = None
+        if solver == "fixed":
+            solution = self.settle(sources)
+            iterations, cycle = solution.iterations, solution.cycle
+            # Fixed-point runs light the board as a whole, there are no per-source traces
+            self.traces = None
+            self.paths = {}
+        elif solver == "superposed":
+            self.traces = {}
+            self.paths = {}
+            self.contributions = {}
+            for source in sources:
+                self.contribute(source)
+            self.superpose(self.state.inRows(set(self.paths) | set(sources)), sources)
+        else:
+            self.traces = {}
+            self.paths = {}
+            for x, y in sources:
+                self.traces[(x, y)] = self.emit(x, y)
+        return result(self.changes(), self.finals(), self.completed(), self.steps, self.exhausted, iterations, cycle)
+
+    def update(self, *positions:tuple[int, int]) -> result:
+        """
+        Recalculate the light after the cells at positions changed (placed, removed,
+        rotated, flipped or edited), retracing only the sources whose light is affected.
+        A source is retraced if its light reached a changed position, or if its light
+        shares a cell with another retraced source (cells mix the light of every source
+        reaching them, so sharing sources are reset and fired again together).
+        After a superposed run, only the sources whose light reached a changed position are
+        retraced: the others keep their contributions, which are added up again where they meet.
+        Falls back to simulate() with the solver of the last run if there is no trace run to start from
+        (e.g. after a fixed-point run).
+
+        Args:
+            positions: Grid positions (x, y) whose cell changed
+
+        Returns:
+            A result with the positions whose visual state changed and the final-cell status
+        """
+        if self.traces is None:
+            return self.simulate(self.fired, self.solved)
+        self.steps = 0
+        self.exhausted = False
+        changed = set(positions)
+        self.sync()
+        self.index(*changed)
+        sources = self.sources() if self.fired is None else [s for s in self.fired if self.layout[s[1]][s[0]].code != kinds.empty]
+        if self.contributions is not None:
+            return self.resuperpose(changed, sources)
+
+        # Light of sources that are gone has to be cleared
+        region = set(changed)
+        for source in [s for s in self.traces if s not in sources]:
+            region |= self.traces.pop(source)
+        # New or changed sources and the sources feeding a changed cell are retraced
+        feeding = {source for x, y in changed for source, side, color in self.feeds(x, y)}
+        dirty = {s for s in sources if s not in self.traces or s in changed or s in feeding}
+
+        while True:
+            # Close over sources sharing cells with the region being reset
+            growing = True
+            while growing:
+                growing = False
+                for source in sources:
+                    if source not in dirty and self.traces[source] & region:
+                        dirty.add(source)
+                        growing = True
+                    if source in dirty and source in self.traces and not self.traces[source] <= region:
+                        region |= self.traces[source]
+                        growing = True
+
+            # Reset the region and fire the dirty sources again, in the same order as a full run
+            for x, y in region:
+                self.layout[y][x].restart()
+                self.paths.pop((x, y), None)
+            lit = set()
+            for x, y in sources:
+                if (x, y) in dirty:
+                    self.traces[(x, y)] = self.emit(x, y)
+                    lit |= self.traces[(x, y)]
+
+            # The new light may now reach cells lit by sources left alone, retrace those too
+            reached = {s for s in sources if s not in dirty and self.traces[s] & lit}
+            region |= lit
+            if not reached:
+                break
+            dirty |= reached
+
+        if self.verify:
+            region |= set(self.crossCheck(sources))
+        return result(self.changes(self.state.inRows(region)), self.finals(), self.completed(), self.steps, self.exhausted)
+
+    def resuperpose(self, changed:set, sources:list[tuple[int, int]]) -> result:
+        """
+        Superposed part of update(): retrace the sources whose light reached a changed position
+        (and new ones), then light again every position whose summed light may differ.
+
+        Args:
+            changed: Grid positions whose cell changed
+            sources: Positions fired as light sources
+
+        Returns:
+            A result with the positions whose visual state changed and the final-cell status
+        """
+        region = set(changed)
+        dirty = [s for s in sources if s not in self.contributions or s in changed or self.traces[s] & changed]
+        # Sources that are gone or retraced take their light away first
+        for source in [s for s in self.contributions if s not in sources] + [s for s in dirty if s in self.contributions]:
+            region |= self.withdraw(source)
+        for source in dirty:
+            self.contribute(source)
+            region |= self.traces[source]
+        region = self.state.inRows(region)
+        for x, y in region:
+            self.layout[y][x].restart()
+        self.superpose(region, sources)
+
+        if self.verify:
+            region += [position for position in self.crossCheck(sources) if position not in region]
+        return result(self.changes(region), self.finals(), self.completed(), self.steps, self.exhausted)
+
+    def crossCheck(self, sources:list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Debug helper for update(): recalculate everything from scratch and log every
+        position whose visual state or beam-path index entry differs from the incremental result.
+
+        Returns:
+            The positions that differed (the board now holds the full result)
+        """
+        incremental = {(x, y): self.layout[y][x].visualState() for x, y in self.positions()}
+        paths, self.paths = self.paths, {}
+        self.restart()
+        if self.contributions is not None:
+            self.traces, self.contributions = {}, {}
+            for source in sources:
+                self.contribute(source)
+            self.superpose(self.state.inRows(set(self.paths) | set(sources)), sources)
+        else:
+            for x, y in sources:
+                self.traces[(x, y)] = self.emit(x, y)
+        # Both the cells and the beam-path index must match
+        wrong = [(x, y) for x, y in self.positions() if self.layout[y][x].visualState() != incremental[(x, y)] or self.paths.get((x, y)) != paths.get((x, y))]
+        if wrong:
+            logging.error(f"Incremental light update differs from a full recalculation at {wrong}")
+        return wrong
+
+    def changes(self, positions=None) -> list[tuple[int, int]]:
+        """
+        Compare cells with their last recorded visual state and record the new one.
+        Changed final cells have their completion re-read for the win check (see completed()).
+
+        Args:
+            positions: Positions to check (the whole grid by default)
+
+        Returns:
+            Positions whose visual state changed, in the order they were checked
+        """
+        changed = []
+        for x, y in (self.positions() if positions is None else positions):
+            state = self.layout[y][x].visualState()
+            if self.visuals.get((x, y)) != state:
+                self.visuals[(x, y)] = state
+                changed.append((x, y))
+                if (x, y) in self.state.goals and not self.layout[y][x].isCompleated:
+                    self.unfinished.add((x, y))
+                else:
+                    self.unfinished.discard((x, y))
+        return changed
+
+    def invalidate(self, *positions:tuple[int, int]):
+        """
+        Forget the recorded visual state of positions so the next run reports them as changed
+        (used when something outside the cell, like an editor tint or an overlay, was drawn on it).
+        """
+        for position in positions:
+            self.visuals.pop(position, None)
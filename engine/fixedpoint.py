@@ -0,0 +1,127 @@
+# Fixed-point light solver: treats the board as a system of edge colors instead of following beams
+# Every cell maps the light entering its four sides to the light leaving them (optics transfer(),
+# applied through its compiled table from engine.transfer on packed colors from engine.rgb),
+# the solver iterates all cells at once until the light entering every side stops changing
+import numpy as np  # Import numpy to find the non-empty cells in the state arrays
+from . import rgb, transfer  # Import packed colors and compiled transfer tables
+
+class solution():
+    """
+    Light entering every side of every lit position once the solver settled.
+    """
+
+    def __init__(self, inputs:dict, iterations:int, cycle:int=0, exhausted:bool=False):
+        """
+        Args:
+            inputs: Dictionary of (x, y) -> four colors (game scale) entering from up, right, down and left
+            iterations: Number of whole-board iterations until the light stopped changing
+            cycle: Length of the loop of states the light fell into (0 if it converged)
+            exhausted: True if the board's step budget ran out before settling
+        """
+        self.inputs = inputs
+        self.iterations = iterations
+        self.cycle = cycle
+        self.exhausted = exhausted
+
+def freeze(inputs:dict) -> tuple:
+    """Hashable, order independent snapshot of the light entering every side."""
+    return tuple(sorted((position, tuple(sides)) for position, sides in inputs.items()))
+
+def brightest(states:list[dict]) -> dict:
+    """Per channel maximum of several packed light states (used to settle a loop of states)."""
+    merged = {}
+    for state in states:
+        for position, sides in state.items():
+            current = merged.setdefault(position, [rgb.black] * 4)
+            for From in range(4):
+                a, b = rgb.channels[current[From]], rgb.channels[sides[From]]
+                current[From] = rgb.pack(tuple(max(a[i], b[i]) for i in range(3)))
+    return merged
+
+def unpack(inputs:dict) -> dict:
+    """Light state with every packed color turned back into an (r, g, b) tuple."""
+    return {position: [rgb.channels[color] for color in sides] for position, sides in inputs.items()}
+
+def trace(board, x:int, y:int, Dir:int, color:int, arrivals:dict) -> bool:
+    """
+    Follow one outgoing color through empty cells up to the next non-empty cell,
+    adding it to the light entering every side it reaches.
+
+    Args:
+        board: Board being solved
+        x, y: Grid position the light leaves from
+        Dir: Direction of travel (0=up, 1=right, 2=down, 3=left)
+        color: Packed color of the light
+        arrivals: Dictionary of (x, y) -> four packed incoming colors being collected
+
+    Returns:
+        False once the board's step budget is spent
+    """
+    # Calculate direction vectors: Up=0, Right=1, Down=2, Left=3 (same as board.propagate)
+    dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
+    From = [2, 3, 0, 1][Dir]
+    # The ray-skip index gives the run of empty cells and the non-empty cell ending it
+    landX, landY, run = board.skips[Dir][y][x]
+    if not board.step(run + (landX is not None)):
+        return False
+    reached = [(x + dx * k, y + dy * k) for k in range(1, run + 1)]
+    # Stop at the first non-empty cell, its transfer decides what happens next
+    if landX is not None:
+        reached.append((landX, landY))
+    for position in reached:
+        sides = arrivals.setdefault(position, [rgb.black] * 4)
+        sides[From] = rgb.added[sides[From] * rgb.size + color]
+    return True
+
+def solve(board, sources:list[tuple[int, int]]) -> solution:
+    """
+    Iterate every non-empty cell's compiled transfer table until the light is stable.
+    All cells read the previous iteration's light, so the outcome does not depend on
+    the order lasers or cells are visited in. If the light falls into a loop of states
+    (e.g. light feeding back into its own filter), the loop is detected by its repeated
+    state and settled to the per channel maximum of the states in it.
+
+    Args:
+        board: Board to solve (its step budget applies)
+        sources: Positions fired as light sources
+
+    Returns:
+        A solution with the light entering every lit position
+    """
+    sources = set(sources)
+    # Non-empty cells in row order (empty cells are crossed by trace())
+    cells = [(int(x), int(y)) for y, x in np.argwhere(board.state.kind)]
+    # Cells keep their configuration while they are solved, look their tables up once
+    tables = {}
+    inputs = {}
+    # Every state seen so far and the iteration it was seen at
+    seen = {freeze(inputs): 0}
+    history = [inputs]
+
+    while True:
+        arrivals = {}
+        # Every cell counts as an interaction, but only lit cells and sources can send light out
+        if not board.step(len(cells)):
+            return solution(unpack(inputs), len(history), exhausted=True)
+        for x, y in cells:
+            if (x, y) not in inputs and (x, y) not in sources:
+                continue
+            compiled = tables.get((x, y))
+            if compiled is None:
+                compiled = tables[(x, y)] = transfer.lookup(board.layout[y][x])
+            outputs = compiled.apply(inputs.get((x, y), transfer.unlit), (x, y) in sources)
+            for Dir, color in outputs.items():
+                if not trace(board, x, y, Dir, color, arrivals):
+                    return solution(unpack(inputs), len(history), exhausted=True)
+
+        state = freeze(arrivals)
+        # Converged: the light entering every side is what it was one iteration ago
+        if state == freeze(inputs):
+            return solution(unpack(arrivals), len(history))
+        # Loop: an earlier state came back, settle on everything lit inside the loop
+        if state in seen:
+            loop = history[seen[state]:]
+            return solution(unpack(brightest(loop)), len(history), cycle=len(loop))
+        seen[state] = len(history)
+        history.append(arrivals)
+        inputs = arrivals
@@ -0,0 +1,1671 @@
+# Pure data models of every cell type (no pygame), used by the headless engine
+# The drawable cells in the cells package inherit from these models and only add textures
+from enum import IntEnum  # Import integer enums for the cell type codes
+from uuid import uuid4  # Import UUID generation for unique level IDs
+from .state import grid, slot, sides, beamState  # Import the array-backed cell state and its views
+from . import rgb  # Import packed colors and their lookup tables
+from .transfer import table  # Import compiled transfer tables
+
+# No light on a side (game scale)
+dark= (0,0,0)
+
+def mix(outputs:dict, side:int, color) -> dict:
+    """
+    Add a color leaving through 'side' to an outputs dictionary.
+    Beams sharing the same side add up per channel, saturating at 10.
+    """
+    if side in outputs:
+        color= rgb.channels[rgb.add(rgb.pack(outputs[side]), rgb.pack(color))]
+    outputs[side]= tuple(color)
+    return outputs
+
+class kinds(IntEnum):
+    """
+    Integer type code of every cell model, stored in the board's kind array.
+    Cells compare equal to their code, so lookups and type checks compare integers.
+    """
+    empty= 0
+    laser= 1
+    block= 2
+    mirror= 3
+    prism= 4
+    glass= 5
+    final= 6
+    level= 7
+
+class default():
+    # Light state lives in the board's arrays, the models only keep their configuration
+    # (the drawable cells add a __dict__ for their textures)
+    __slots__= ("slot", "inputView", "xy", "name", "stateX", "stateY", "breaks")
+
+    # Direction mapping array: maps input directions to their opposite directions
+    # Used for light beam calculations and direction conversions
+    dirFrom= [2,3,0,1]
+
+    # Type code stored in the board's kind array
+    code= kinds.empty
+    # True if the cell keeps light state outside the grid arrays (reset through cleared())
+    keepsLight= False
+    # Registries the board files the cell under (see engine.state.grid.place):
+    # emitters are fired as light sources, goals decide whether the level is completed
+    emitter= False
+    goal= False
+
+    def __init__(self, xy: tuple[int, int]|None = None, name:str="D", breaks=None, layout=None, data=None):
+        """
+        Initialize the light state of a cell: position, rotation, inputs and beam states.
+        The state lives in a private 1x1 grid until a board binds the cell to its own grid.
+        """
+        # Slot of the grid arrays holding this cell's state
+        self.slot= slot(grid(1, 1), 0, 0)
+        self.slot.grid.kind[0, 0]= self.code
+        self.slot.grid.keeps[0, 0]= self.keepsLight
+        # Views over the slot standing in for the inputs list and the beam state dictionaries
+        self.inputView= sides(self)
+
+        # Store cell position in grid coordinates
+        self.xy = xy
+        # Store cell identifier/name
+        self.name = name
+
+        # Set default data if none provided
+        if data is None or data == {}:
+            data= {"direction":0}
+        # Store rotation direction (0-3 for 0°, 90°, 180°, 270°)
+        self.direction= data["direction"]
+
+        # Light input array for 4 directions (up, right, down, left), starts unlit
+
+        # Horizontal beam state (left-right light flow): colorA, colorB, breakA, breakB, vertical
+        self.stateX= beamState(self, vertical=False)
+        # Vertical beam state (up-down light flow)
+        self.stateY= beamState(self, vertical=True)
+
+        # Initialize list of directions where light breaks/stops
+        self.breaks= breaks if breaks is not None else []
+
+    @property
+    def direction(self) -> int:
+        """Rotation (0-3 for 0°, 90°, 180°, 270°), stored in the grid's direction array."""
+        return int(self.slot.grid.direction[self.slot.y, self.slot.x])
+
+    @direction.setter
+    def direction(self, direction:int):
+        self.slot.grid.direction[self.slot.y, self.slot.x]= direction
+
+    @property
+    def inputs(self) -> sides:
+        """Colors entering from up, right, down and left (a view over the grid's inputs array)."""
+        return self.inputView
+
+    @inputs.setter
+    def inputs(self, colors):
+        self.slot.grid.inputs[self.slot.y, self.slot.x]= [rgb.pack(color) for color in colors]
+
+    def bind(self, state:grid, x:int, y:int):
+        """
+        Move the cell's state into slot (x, y) of a grid (called by the board).
+        A cell previously bound there gets its state moved to a private grid.
+
+        Args:
+            state: Grid to move into
+            x, y: Position in that grid
+        """
+        previous= state.cells[y][x]
+        if previous is not None and previous is not self:
+            previous.detach()
+        target= slot(state, x, y)
+        # Copy every property over, then read and write through the new slot
+        self.slot.copy(target)
+        state.place(self, x, y)
+        self.slot= target
+
+    def detach(self):
+        """Move the cell's state to a private grid (the cell was replaced on its board)."""
+        self.slot.grid.place(None, self.slot.x, self.slot.y)
+        self.bind(grid(1, 1), 0, 0)
+
+    def cleared(self):
+        """
+        Called by the board after it cleared the light of the cell directly in the grid arrays.
+        Default implementation keeps no other light state.
+        """
+        pass
+
+    def changeDirection(self, direction: int):
+        """
+        Update the cell's rotation direction.
+        Direction values: 0=0°, 1=90°, 2=180°, 3=270°
+        """
+        self.direction = direction
+
+    def editProperty(self, index:int, changing:int):
+        """
+        Attempt to modify a cell property.
+        Default implementation returns False (no properties can be edited).
+        Overridden by subclasses that have editable properties.
+        """
+        return False
+
+    def getData(self, pocket=False):
+        """
+        Serialize cell data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns default/template data (direction=0)
+                   If False, returns current cell state data
+
+        Returns:
+            Dictionary containing cell type and configuration data
+        """
+        if pocket:
+            # Return template data for level editor palette
+            return {
+                "type": self.__class__.__name__.lower(),
+                "data": {
+                    "direction": 0
+                }
+            }
+
+        # Return current cell state for level saving
+        return {
+            "type": self.__class__.__name__.lower(),
+            "data": {
+                "direction": self.direction
+            }
+        }
+
+    def changeBeamStates(self, vertical=False, beamDirs=None, **states):
+        """
+        Update beam states for light visualization.
+
+        Args:
+            vertical: True for vertical beams (up-down), False for horizontal (left-right)
+            beamDirs: List of specific beam directions to update (0=up, 1=right, 2=down, 3=left)
+            **states: State properties to update (colorA, colorB, breakA, breakB, etc.)
+                Colors stay in game scale (0-10), the renderers convert them (see engine.scale)
+        """
+        # Update states for all beams in a direction (vertical or horizontal)
+        if beamDirs is None:
+            if vertical:
+                # Update vertical beam states (up-down light flow)
+                for key, value in states.items():
+                    if key in self.stateY:
+                        self.stateY[key]= value
+            else:
+                # Update horizontal beam states (left-right light flow)
+                for key, value in states.items():
+                    if key in self.stateX:
+                        self.stateX[key]= value
+        else:
+            # Update states for specific beam directions
+            for i in beamDirs:
+                match i:
+                    case 0:  # Up direction - vertical beam A
+                        for key, value in states.items():
+                            if key == "color":
+                                self.stateY["colorA"]= value
+                            else:
+                                self.stateY[key]= value
+                    case 1:  # Right direction - horizontal beam A
+                        for key, value in states.items():
+                            if key == "color":
+                                self.stateX["colorA"]= value
+                            else:
+                                self.stateX[key] = value
+                    case 2:  # Down direction - vertical beam B
+                        for key, value in states.items():
+                            if key == "color":
+                                self.stateY["colorB"]= value
+                            else:
+                                self.stateY[key]= value
+                    case 3:  # Left direction - horizontal beam B
+                        for key, value in states.items():
+                            if key == "color":
+                                self.stateX["colorB"]= value
+                            else:
+                                self.stateX[key]= value
+
+    def convDir(self, wantedDir):
+        """
+        Convert direction based on cell's current rotation.
+
+        Args:
+            wantedDir: Direction to convert (0=up, 1=right, 2=down, 3=left)
+
+        Returns:
+            Adjusted direction accounting for cell's rotation
+        """
+        # Direction conversion matrix based on cell rotation:
+        # Each row represents a rotation state (0°, 90°, 180°, 270°)
+        # Each column maps input direction to rotated direction
+        return [[0,1,2,3],[1,2,3,0],[2,3,0,1],[3,0,1,2]][self.direction][wantedDir]
+
+    def checkBreak(self, From):
+        """
+        Check if incoming light should break/stop at this cell.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+
+        Returns:
+            True if light breaks, False if it passes through
+        """
+        # Adjust break directions based on cell's rotation
+        breaks= []
+        for b in self.breaks:
+            b+= self.direction
+            if b > 3:
+                b -= 4
+            breaks.append(b)
+
+        # Check if light breaks at the entry point
+        if From in breaks:
+            # Determine which beam type (vertical/horizontal) based on direction
+            match From:
+                case 0 | 2:  # Up or Down - vertical beam
+                    beam= True
+                case 1 | 3:  # Right or Left - horizontal beam
+                    beam= False
+
+            # Set appropriate break flag based on entry direction
+            match From:
+                case 0 | 1:  # Up or Right - affects beam A
+                    self.changeBeamStates(beam, breakA=True)
+                case 3 | 2:  # Left or Down - affects beam B
+                    self.changeBeamStates(beam, breakB=True)
+
+            return True
+
+        # Check if light breaks at the opposite direction (exit point)
+        if [2, 3, 0, 1][From] in breaks:
+            return True
+
+        return False
+
+    def restart(self):
+        """
+        Reset cell to initial state.
+        Clears all light inputs and beam states for a fresh puzzle start.
+        """
+        # Clear all
+        self.inputs= [(0,0,0), (0,0,0), (0,0,0), (0,0,0)]
+        # Reset vertical beam states (no color, no breaks)
+        self.changeBeamStates(True, colorA= (0,0,0), colorB=(0,0,0), breakA= False, breakB= False)
+        # Reset horizontal beam states (no color, no breaks)
+        self.changeBeamStates(False, colorA= (0,0,0), colorB=(0,0,0), breakA= False, breakB= False)
+
+    def changeLight(self, From, color=None):
+        """
+        Process incoming light and update cell's beam states.
+        Handles light combining, breaking, and beam state updates.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB tuple for light color, defaults to (0,0,0) if None
+
+        Returns:
+            Tuple of (light_data_dict, break_occurred_bool)
+        """
+        # Set default color if none provided
+        if color is None:
+            color=(0,0,0)
+        # Store light input for this direction
+        self.inputs[From] = color
+
+        # Handle vertical light (up/down directions)
+        if From in [0, 2]:
+            # Check if light should break at this cell
+            Break= self.checkBreak(From)
+            if Break:
+                # Light breaks - create separate beams for A and B
+                match From:
+                    case 0:  # Light from above - affects beam A
+                        colorA= color
+                        self.changeBeamStates(colorA= colorA, vertical=True)
+                    case 2:  # Light from below - affects beam B
+                        colorB= color
+                        self.changeBeamStates(colorB=colorB, vertical=True)
+            else:
+                # Light passes through - combine with opposite direction input
+                # Add RGB values with opposite direction, clamping to max of 10
+                Color= rgb.channels[rgb.add(rgb.pack(color), self.inputs.packed(self.dirFrom[From]))]
+                colorA= Color
+                colorB= Color
+                self.changeBeamStates(colorA= colorA, colorB=colorB, vertical=True)
+
+        else:  # Handle horizontal light (left/right directions)
+            # Check if light should break at this cell
+            Break= self.checkBreak(From)
+            if Break:
+                # Light breaks - create separate beams for A and B
+                match From:
+                    case 1:  # Light from right - affects beam A
+                        colorA= color
+                        self.changeBeamStates(vertical=False, colorA= colorA)
+                    case 3:  # Light from left - affects beam B
+                        colorB= color
+                        self.changeBeamStates(vertical=False, colorB=colorB)
+            else:
+                # Light passes through - combine with opposite direction input
+                # Add RGB values with opposite direction, clamping to max of 10
+                Color= rgb.channels[rgb.add(rgb.pack(color), self.inputs.packed(self.dirFrom[From]))]
+                colorA= Color
+                colorB= Color
+                self.changeBeamStates(vertical=False, colorA= colorA, colorB=colorB)
+
+        # Return light data and break status for game logic
+        return {From:color}, Break
+
+    def __eq__(self, other):
+        """
+        Compare cell with another object for equality.
+        Used for cell type identification in game logic: type codes (kinds) compare
+        with the cell's code, strings with the first letter of its level ID.
+        """
+        if isinstance(other, int):
+            return self.code == other
+        if self.name == "D":
+            return "D" == other
+        else:
+            return self.name[0].upper() == other
+
+    def convert(self, other:object, name=None, layout= None, data= None):
+        """
+        Convert this cell to a different cell type while preserving state.
+
+        Args:
+            other: Target cell class to convert to
+            name: New cell name/identifier
+            layout: Layout data for new cell
+            data: Configuration data for new cell
+
+        Returns:
+            New cell instance of the target type with preserved light inputs
+        """
+        if data is not None:
+            data= data.copy()
+        # Create new cell instance with same position and provided parameters
+        new= other(xy= self.xy, name=name, layout= layout, data= data)
+        # Preserve current light inputs in the new cell
+        new.inputs= self.inputs.copy()
+        return new
+
+    def flip(self):
+        """
+        Attempt to flip/mirror the cell.
+        Default implementation returns False (cannot be flipped).
+        Overridden by cells that support flipping (like mirrors).
+        """
+        return False
+
+    def blocks(self, From:int) -> bool:
+        """
+        Side-effect free version of checkBreak: True if light entering from 'From'
+        is stopped by a breaking wall at its entry or exit side.
+        """
+        breaks= [(b + self.direction) % 4 for b in self.breaks]
+        return From in breaks or self.dirFrom[From] in breaks
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """
+        Pure light transfer function used by the fixed-point solver.
+        Maps the color entering each side to the color leaving each side,
+        without touching the cell state.
+
+        Args:
+            inputs: Four colors (game scale) entering from up, right, down and left
+            source: True if the cell is fired as a light source this run
+
+        Returns:
+            Dictionary of side -> color leaving through that side
+        """
+        # Empty cells let light through in a straight line
+        outputs= {}
+        for From in range(4):
+            if inputs[From] != dark and not self.blocks(From):
+                mix(outputs, self.dirFrom[From], inputs[From])
+        return outputs
+
+    def configuration(self) -> tuple:
+        """
+        Hashable key of everything transfer() depends on, compiled tables are shared by key
+        (see engine.transfer.lookup). Subclasses append the properties their transfer reads.
+        """
+        return (self.code, self.direction, tuple(self.breaks))
+
+    def compileTransfer(self) -> table:
+        """
+        Compile transfer() for the current configuration into routes over packed colors
+        (see engine.transfer.table). Empty cells let light straight through their open sides.
+        """
+        return table([() if self.blocks(From) else ((self.dirFrom[From], None),) for From in range(4)])
+
+    def settle(self, inputs, source:bool=False):
+        """
+        Bring beam states and status in line with the final incoming light of a
+        fixed-point solve (the cell has been restarted before).
+
+        Args:
+            inputs: Four colors (game scale) entering from up, right, down and left
+            source: True if the cell was fired as a light source this run
+        """
+        # Sources run their emission once so their own beam states are set
+        if source:
+            self.changeLight()
+        # Feed every lit side in a fixed order, the beam states combine all inputs
+        for From in range(4):
+            if inputs[From] != dark:
+                self.changeLight(From, inputs[From])
+
+    def visualState(self) -> tuple:
+        """
+        Hashable summary of everything that affects how the cell looks.
+        Two calls returning equal values mean the cell does not need to be redrawn.
+        Subclasses append the properties their textures display.
+        """
+        slot= self.slot
+        # Packed beam colors of the four sides and the break flags, read from the arrays as plain tuples
+        return (self.code, self.name, self.direction, tuple(slot.grid.beams[slot.y, slot.x].tolist()), tuple(slot.grid.breaks[slot.y, slot.x].ravel().tolist()))
+
+class laser(default):
+    """
+    Laser model that generates colored light based on user-configurable RGB values.
+    """
+
+    __slots__= ("color",)
+
+    # Type code stored in the board's kind array
+    code= kinds.laser
+    # Fired as a light source
+    emitter= True
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "L", layout=None, data=None, **kwargs):
+        """
+        Initialize a laser with its RGB output.
+
+        Args:
+            xy: Grid coordinates (x,y) where the laser is placed
+            name: Cell identifier/name for the laser
+            layout: Grid layout information (unused for lasers)
+            data: Dictionary with color (RGB tuple) and direction settings
+        """
+        # Set default configuration if none provided
+        if data is None:
+            data = {"color": (0,0,0), "direction": 0}
+
+        # Laser blocks light from sides and back (directions 1,2,3)
+        # Only emits light in the forward direction (direction 0 relative to rotation)
+        super().__init__(xy= xy, name= name, breaks=[1,2,3], layout= layout, data= data)
+
+        # Store laser color configuration
+        self.color = tuple(data["color"])
+
+    def editProperty(self, index:int, changing:int):
+        """
+        Edit the RGB color intensity for a specific channel of the laser.
+        Used by the level editor to adjust laser output colors.
+
+        Args:
+            index: Intensity value for the channel (0=max/10, None=off/0, 1-9=that value)
+            changing: Which RGB channel to modify (R=0, G=1, B=2)
+
+        Returns:
+            True indicating the property edit was successful
+        """
+        # Handle intensity value mapping
+        if index is not None:
+            if index == 0:
+                index = 10  # Special case: 0 maps to maximum intensity (10)
+            # Update the specified color channel
+            current = list(self.color)
+            current[changing] = index
+            self.color = tuple(current)
+        else:
+            # Set channel to off (0 intensity)
+            current = list(self.color)
+            current[changing] = 0
+            self.color = tuple(current)
+        return True
+
+    def changeLight(self, From=None, color=None):
+        """
+        Handle light interactions with the laser cell.
+
+        Args:
+            From: Direction of incoming light (if any)
+            color: Color of incoming light (if any)
+
+        Returns:
+            Tuple of (light_output_dict, light_blocked_bool)
+        """
+        if From is not None:
+            # If light is coming from outside, handle it normally (will be blocked by breaks)
+            return super().changeLight(From, color)
+        else:
+            # If no incoming light specified, this is the laser generating its own light
+            # Emit laser's configured color in its facing direction
+            return {self.direction: self.color}, False
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Lasers absorb incoming light and emit their color forward when fired."""
+        if source and self.color != dark:
+            return {self.direction: self.color}
+        return {}
+
+    def configuration(self) -> tuple:
+        """Laser transfer also depends on its output color."""
+        return super().configuration() + (tuple(self.color),)
+
+    def compileTransfer(self) -> table:
+        """Lasers absorb everything and emit their color forward when fired."""
+        return table(emits={self.direction: rgb.pack(self.color)} if tuple(self.color) != dark else {})
+
+    def getData(self, pocket=False):
+        """
+        Serialize laser data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current laser state for level saving
+
+        Returns:
+            Dictionary containing laser type and configuration data
+        """
+        # Get base cell data from parent class
+        data= super().getData()
+
+        if pocket:
+            # Return template data for level editor (includes color for configuration)
+            data["data"]= {
+                "direction": 0,           # Default rotation
+                "color": self.color       # Current color (preserved in template)
+            }
+            return data
+
+        # Return current laser state data for level saving
+        data["data"]= {
+            "direction": self.direction,  # Current rotation direction
+            "color": self.color           # Current RGB color settings
+        }
+        return data
+
+    def visualState(self) -> tuple:
+        """Laser appearance also depends on its output color."""
+        return super().visualState() + (self.color,)
+
+class xblock(default):
+    """
+    Block model that completely blocks light from passing through.
+    """
+
+    __slots__= ()
+
+    # Type code stored in the board's kind array
+    code= kinds.block
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "X", layout=None, data=None, **kwargs):
+        """
+        Initialize a block that stops light from every direction.
+
+        Args:
+            xy: Grid coordinates (x,y) where the block is placed
+            name: Cell identifier/name for the block (default "X")
+            layout: 2D array representing the level layout (used by the drawable block)
+            data: Configuration data (inherited from parent class)
+        """
+        # All directions are breaking walls (blocks all light)
+        super().__init__(xy= xy, name= name, breaks=[0,1,2,3], layout= layout, data= data)
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Blocks absorb all light."""
+        return {}
+
+    def compileTransfer(self) -> table:
+        """Blocks absorb all light."""
+        return table()
+
+class mirror(default):
+    """
+    Mirror model that reflects light beams at 90-degree angles.
+    Supports two orientations that determine the reflection pattern.
+    """
+
+    __slots__= ()
+
+    # Type code stored in the board's kind array
+    code= kinds.mirror
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "M", layout=None, data=None, **kwargs):
+        """
+        Initialize a mirror.
+
+        Args:
+            xy: Grid coordinates (x,y) where the mirror is placed
+            name: Cell identifier/name for the mirror
+            layout: Grid layout information (unused for mirrors)
+            data: Dictionary with relevant data (direction for reflection orientation)
+        """
+        # Set default configuration if none provided
+        if data is None:
+            data = {"direction": 0}
+
+        # No breaking walls (light passes through via reflection)
+        super().__init__(xy= xy, name= name, breaks=[], layout= layout, data= data)
+
+    def changeDirection(self, direction):
+        """
+        Update the mirror's reflection orientation.
+        Note: Mirror only supports two orientations (0 and 1), mapped from input direction.
+
+        Args:
+            direction: Input direction (0-3), mapped to mirror orientation (0 or 1)
+        """
+        # Map input direction to mirror orientation: even numbers→1, odd numbers→0
+        direction= [1,0][self.direction]
+        return super().changeDirection(direction)
+
+    def changeLight(self, From=None, color=None):
+        """
+        Process light reflection through the mirror.
+        Reflects incoming light at 90-degree angles based on mirror orientation.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB color tuple of the incoming light
+
+        Returns:
+            Tuple of (reflected_light_dict, light_blocked_bool)
+        """
+        # Handle case where no specific input direction is given (process all inputs)
+        if From is None:
+            end= {}
+            # Process all active light inputs and calculate their reflections
+            for i in range(4):
+                if self.inputs[i] != (0,0,0):
+                    # Recursively process each input and map to reflection direction
+                    self.changeLight(i, self.inputs[i])
+                    # Map input direction to output direction based on mirror orientation
+                    # Direction mappings: [3,2,1,0] for orientation 0, [1,0,3,2] for orientation 1
+                    end[[[3,2,1,0],[1,0,3,2]][self.direction][i]]= color
+            return end.copy(), False
+        else:
+            # Process specific light input
+            if color is None:
+                color=(0,0,0)
+
+            # Store the incoming light
+            self.inputs[From] = color
+
+            # Calculate reflected light color by combining with light from reflection partner
+            # The reflection mapping depends on mirror orientation
+            reflection_partner = [[3,2,1,0],[1,0,3,2]][self.direction][From]
+            Color= rgb.channels[rgb.add(rgb.pack(color), self.inputs.packed(reflection_partner))]
+
+            # Update beam states based on incoming light direction
+            match From:
+                case 0:  # Light from above
+                    self.changeBeamStates(vertical=True, colorA= Color)
+                case 1:  # Light from right
+                    self.changeBeamStates(vertical=False, colorA= Color)
+                case 2:  # Light from below
+                    self.changeBeamStates(vertical=True, colorB= Color)
+                case 3:  # Light from left
+                    self.changeBeamStates(vertical=False, colorB= Color)
+
+            # Update beam states for reflected light based on mirror orientation
+            match self.direction:
+                case 0:  # Mirror orientation 0 (\ diagonal reflection)
+                    match From:
+                        case 0:  # Up → Left
+                            self.changeBeamStates(vertical=False, colorB= Color)
+                        case 1:  # Right → Down
+                            self.changeBeamStates(vertical=True, colorB= Color)
+                        case 2:  # Down → Right
+                            self.changeBeamStates(vertical=False, colorA= Color)
+                        case 3:  # Left → Up
+                            self.changeBeamStates(vertical=True, colorA= Color)
+
+                case 1:  # Mirror orientation 1 (/ diagonal reflection)
+                    match From:
+                        case 0:  # Up → Right
+                            self.changeBeamStates(vertical=False, colorA= Color)
+                        case 1:  # Right → Up
+                            self.changeBeamStates(vertical=True, colorA= Color)
+                        case 2:  # Down → Left
+                            self.changeBeamStates(vertical=False, colorB= Color)
+                        case 3:  # Left → Down
+                            self.changeBeamStates(vertical=True, colorB= Color)
+
+            # Return reflected light in the calculated direction
+            reflection_direction = [[3,2,1,0],[1,0,3,2]][self.direction][From]
+            return {reflection_direction: color}, False
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Mirrors send the light of every side out through its reflection side."""
+        outputs= {}
+        for From in range(4):
+            if inputs[From] != dark:
+                mix(outputs, [[3,2,1,0],[1,0,3,2]][self.direction][From], inputs[From])
+        return outputs
+
+    def compileTransfer(self) -> table:
+        """Mirrors route every side to its reflection side, unchanged."""
+        reflection= [[3,2,1,0],[1,0,3,2]][self.direction]
+        return table([((reflection[From], None),) for From in range(4)])
+
+    def getData(self, pocket=False):
+        """
+        Serialize mirror data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current mirror state for level saving
+
+        Returns:
+            Dictionary containing mirror type and configuration data
+        """
+        # Get base cell data from parent class
+        data= super().getData()
+
+        if pocket:
+            # Return template data for level editor (default orientation)
+            data["data"]= {
+                "direction": 0  # Default mirror orientation
+            }
+            return data
+
+        # Return current mirror state data for level saving
+        data["data"]= {
+            "direction": self.direction  # Current reflection orientation
+        }
+        return data
+
+class prism(default):
+    """
+    Prism model that can split white light into RGB components or combine RGB into white.
+    Supports two orientations (normal and flipped) that affect the color splitting/combining behavior.
+    """
+
+    __slots__= ("pastOutput",)
+
+    # Type code stored in the board's kind array
+    code= kinds.prism
+    # The loop heuristic keeps the last output outside the grid arrays
+    keepsLight= True
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "P", layout=None, data=None, **kwargs):
+        """
+        Initialize a prism with its orientation.
+
+        Args:
+            xy: Grid coordinates (x,y) where the prism is placed
+            name: Cell identifier/name for the prism
+            layout: Grid layout information (if needed for context)
+            data: Dictionary with relevant data (direction, flipped state)
+        """
+        # Set default configuration if none provided
+        if data is None:
+            data = {"direction": 0, "flipped": False}
+
+        # No breaking walls (light passes through)
+        super().__init__(xy= xy, name= name, breaks=[], layout= layout, data= data)
+
+        # Track previous output to detect state changes and prevent infinite loops
+        self.pastOutput= rgb.black
+
+        # Ensure flipped property exists in data
+        if "flipped" not in data:
+            data["flipped"]= False
+
+        # Set initial flip state
+        self.flipped= data["flipped"] == True
+
+    def changeLight(self, From=None, color=None):
+        """
+        Process incoming light through the prism - either split white light into RGB or combine RGB into white.
+        The prism behavior depends on its orientation (normal vs flipped) and the light entry direction.
+
+        Args:
+            From: Direction the light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB color tuple of the incoming light
+
+        Returns:
+            Tuple of (output_light_dict, light_blocked_bool)
+        """
+        # Set default color if none provided
+        if color is None:
+            color= (0,0,0)
+
+        # Store the incoming light in the appropriate input slot
+        self.inputs[From]= color
+
+        # Process light based on prism orientation (normal vs flipped)
+        if not self.flipped:
+            # Normal orientation: calculate combined light colors
+            # For each RGB channel, combine light from opposite directions (3-i maps R→B, G→G, B→R)
+            main, red, green, blue= [self.inputs.packed(self.convDir(i)) for i in [0, 3, 2, 1]]
+            colors= rgb.add(rgb.merge(red, green, blue), main)
+
+            # Create individual color beams for each output direction
+            colorRside= rgb.channels[rgb.merge(colors, red, red)]        # Red output
+            colorGside= rgb.channels[rgb.merge(green, colors, green)]    # Green output
+            colorBside= rgb.channels[rgb.merge(blue, blue, colors)]      # Blue output
+
+            # Update beam states for all output directions
+            self.changeBeamStates(beamDirs=[self.convDir(3)], color= colorRside)
+            self.changeBeamStates(beamDirs=[self.convDir(2)], color= colorGside)
+            self.changeBeamStates(beamDirs=[self.convDir(1)], color= colorBside)
+            self.changeBeamStates(beamDirs=[self.convDir(0)], color= rgb.channels[colors])
+
+        else:
+            # Flipped orientation: different mapping for RGB separation/combination
+            # For each RGB channel, combine light from sequential directions (i+1 maps R→G, G→B, B→R)
+            main, red, green, blue= [self.inputs.packed(self.convDir(i)) for i in [0, 1, 2, 3]]
+            colors= rgb.add(rgb.merge(red, green, blue), main)
+
+            # Create individual color beams for flipped output directions
+            colorRside= rgb.channels[rgb.merge(colors, red, red)]        # Red output
+            colorGside= rgb.channels[rgb.merge(green, colors, green)]    # Green output
+            colorBside= rgb.channels[rgb.merge(blue, blue, colors)]      # Blue output
+
+            # Update beam states for all flipped output directions
+            self.changeBeamStates(beamDirs=[self.convDir(1)], color= colorRside)
+            self.changeBeamStates(beamDirs=[self.convDir(2)], color= colorGside)
+            self.changeBeamStates(beamDirs=[self.convDir(3)], color= colorBside)
+            self.changeBeamStates(beamDirs=[self.convDir(0)], color= rgb.channels[colors])
+
+        # Determine output behavior based on light entry direction
+        if From == self.direction: # Light entering from the main direction - SPLIT white into RGB
+            # Output pure RGB beams to directions 3, 2, 1 (normal) or 1, 2, 3 (flipped)
+            return {self.convDir(side): rgb.channels[rgb.parts[i][main]] for i, side in enumerate([1, 2, 3] if self.flipped else [3, 2, 1])}, False
+
+        else: # Light entering from side directions - COMBINE RGB into white
+            # Extract one RGB channel from each side (3, 2, 1 when normal, 1, 2, 3 when flipped)
+            outColor= rgb.merge(red, green, blue)
+
+            # Prevent infinite loops by checking if output has changed
+            if outColor == self.pastOutput:
+                self.pastOutput= colors
+                return {}, True  # Block propagation to prevent loops
+            else:
+                self.pastOutput= colors
+                return {self.convDir(0):rgb.channels[outColor]}, False  # Output combined white light
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """
+        Prisms split the light of their main side into one channel per side and combine
+        one channel of every side into the main side (no loop heuristic needed here,
+        the fixed-point solver handles loops).
+        """
+        outputs= {}
+        main= inputs[self.convDir(0)]
+        # Channel sides: R, G, B leave (and are collected) through these sides
+        sides= [self.convDir(1), self.convDir(2), self.convDir(3)] if self.flipped else [self.convDir(3), self.convDir(2), self.convDir(1)]
+
+        # SPLIT: light on the main side leaves as pure channels
+        if main != dark:
+            for i, side in enumerate(sides):
+                mix(outputs, side, tuple(main[i] if j == i else 0 for j in range(3)))
+
+        # COMBINE: each channel side contributes its own channel to the main side
+        if any(inputs[side] != dark for side in sides):
+            combined= tuple(inputs[sides[i]][i] for i in range(3))
+            mix(outputs, self.convDir(0), combined)
+        return outputs
+
+    def configuration(self) -> tuple:
+        """Prism transfer also depends on its orientation."""
+        return super().configuration() + (self.flipped,)
+
+    def compileTransfer(self) -> table:
+        """Prisms route one channel of the main side to every channel side and combine the channel sides."""
+        main= self.convDir(0)
+        sides= [self.convDir(1), self.convDir(2), self.convDir(3)] if self.flipped else [self.convDir(3), self.convDir(2), self.convDir(1)]
+        routes= [(), (), (), ()]
+        routes[main]= tuple((side, rgb.parts[i]) for i, side in enumerate(sides))
+        return table(routes, combine=(main, tuple(sides)))
+
+    @property
+    def flipped(self) -> bool:
+        """Orientation (False=normal, True=flipped), stored in the grid's flipped array."""
+        return bool(self.slot.grid.flipped[self.slot.y, self.slot.x])
+
+    @flipped.setter
+    def flipped(self, flipped:bool):
+        self.slot.grid.flipped[self.slot.y, self.slot.x]= flipped
+
+    def restart(self):
+        """
+        Reset the prism to initial state for a new puzzle attempt.
+        Clears the previous output tracking and calls parent restart method.
+        """
+        # Reset output tracking to prevent state carryover between puzzle attempts
+        self.pastOutput= rgb.black
+        return super().restart()
+
+    def cleared(self):
+        """Clear the previous output tracking after the board cleared the prism's light."""
+        self.pastOutput= rgb.black
+
+    def flip(self):
+        """
+        Toggle the prism between normal and flipped orientations.
+
+        Returns:
+            True indicating the flip operation was successful
+        """
+        # Toggle the internal flip state
+        self.flipped= not self.flipped
+        return True
+
+    def getData(self, pocket=False):
+        """
+        Serialize prism data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current prism state for level saving
+
+        Returns:
+            Dictionary containing prism type and configuration data
+        """
+        # Get base cell data from parent class
+        data= super().getData()
+
+        if pocket:
+            # Return template data for level editor (default values)
+            data["data"]= {
+                "direction": 0,      # Default rotation
+                "flipped": 0         # Default orientation (normal)
+            }
+            return data
+
+        # Return current prism state data for level saving
+        data["data"]= {
+            "direction": self.direction,  # Current rotation direction
+            "flipped": self.flipped       # Current flip state
+        }
+        return data
+
+    def visualState(self) -> tuple:
+        """Prism appearance also depends on its orientation."""
+        return super().visualState() + (self.flipped,)
+
+class glass(default):
+    """
+    Glass model that modifies light intensity as it passes through.
+    Light glass (type 0) amplifies and dark glass (type 1) attenuates by its potency.
+    """
+
+    __slots__= ("type", "potency")
+
+    # Type code stored in the board's kind array
+    code= kinds.glass
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "G", layout=None, data=None, **kwargs):
+        """
+        Initialize a glass with its type and potency.
+
+        Args:
+            xy: Grid coordinates (x,y) where the glass is placed
+            name: Cell identifier/name for the glass
+            layout: Grid layout information (unused for glass)
+            data: Dictionary with direction, type (0=light/1=dark), and potency settings
+        """
+        # Set default configuration if none provided
+        if data is None:
+            data = {"direction": 0, "type":0, "potency": 5}
+
+        # Glass blocks light from top and bottom (directions 0,2)
+        # Light can only pass through horizontally (left-right)
+        super().__init__(xy= xy, name= name, breaks=[0,2], layout= layout, data= data)
+
+        # Store glass properties
+        self.type= data["type"]      # 0 = Light glass (amplifies), 1 = Dark glass (attenuates)
+        self.potency= data["potency"] # Strength of the amplification/attenuation effect
+
+    def changeDirection(self, direction):
+        """
+        Update the glass rotation direction with constraint.
+        Glass is symmetric, so direction 2 is mapped to 0 for simplicity.
+
+        Args:
+            direction: New rotation direction (0-3), with 2 automatically converted to 0
+        """
+        # Map direction 2 to 0 since glass is rotationally symmetric
+        if direction == 2:
+            direction = 0
+        return super().changeDirection(direction)
+
+    def changeLight(self, From=None, color=None):
+        """
+        Process light passing through the glass with intensity modification.
+        Light glass amplifies brightness, dark glass reduces it.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB color tuple of the incoming light
+
+        Returns:
+            Tuple of (modified_light_dict, light_blocked_bool)
+        """
+        # Set default color if none provided
+        if color is None:
+            color= (0,0,0)
+
+        # Store the incoming light
+        self.inputs[From]= color
+
+        # Check if light hits a blocking wall (top/bottom for this glass orientation)
+        if self.checkBreak(From):
+            # Light is blocked - update beam state but don't pass through
+            match From:
+                    case 0:  # Light from above - blocked
+                        self.changeBeamStates(colorA= color, vertical=True)
+                    case 1:  # Light from right - passes through (shouldn't break)
+                        self.changeBeamStates(colorA=color, vertical=False)
+                    case 2:  # Light from below - blocked
+                        self.changeBeamStates(colorB=color, vertical=True)
+                    case 3:  # Light from left - passes through (shouldn't break)
+                        self.changeBeamStates(colorB=color, vertical=False)
+            return {}, True  # Light blocked, no output
+
+        # Light passes through - apply glass effect based on type
+        if self.type == 1:  # Dark glass - attenuates/reduces light intensity
+            # Calculate attenuated light for display (combines input with opposite direction):
+            # per channel, light arriving on a side plus the opposite light minus the potency where it is lit,
+            # floored at 0 (a channel below the potency dims the other side) and saturating at 10
+            incoming, opposite= rgb.pack(color), self.inputs.packed(self.dirFrom[From])
+            attenuated, shortfall= rgb.attenuated[self.potency], rgb.shortfall[self.potency]
+            colorA= rgb.channels[rgb.subtract(rgb.add(incoming, attenuated[opposite]), shortfall[opposite])]
+            colorB= rgb.channels[rgb.subtract(rgb.add(opposite, attenuated[incoming]), shortfall[incoming])]
+
+            # Update beam states for both directions
+            self.changeBeamStates(beamDirs=[From], color= colorA)
+            self.changeBeamStates(beamDirs=[self.dirFrom[From]], color= colorB)
+
+            # Output attenuated light (subtract potency, minimum 0)
+            output_color = rgb.channels[rgb.attenuated[self.potency][incoming]]
+            return {self.dirFrom[From]: output_color}, False
+
+        else:  # Light glass - amplifies/increases light intensity
+            # Calculate amplified light for display (combines input with opposite direction)
+            incoming, opposite= rgb.pack(color), self.inputs.packed(self.dirFrom[From])
+            colorA= rgb.channels[rgb.add(incoming, rgb.amplified[self.potency][opposite])]
+            colorB= rgb.channels[rgb.add(opposite, rgb.amplified[self.potency][incoming])]
+
+            # Update beam states for both directions
+            self.changeBeamStates(beamDirs=[From], color= colorA)
+            self.changeBeamStates(beamDirs=[self.dirFrom[From]], color= colorB)
+
+            # Output amplified light (add potency, maximum 10)
+            output_color = rgb.channels[rgb.amplified[self.potency][incoming]]
+            return {self.dirFrom[From]: output_color}, False
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Glass passes light straight through its open sides, amplified or attenuated by its potency."""
+        outputs= {}
+        effect= rgb.attenuated[self.potency] if self.type == 1 else rgb.amplified[self.potency]
+        for From in range(4):
+            if inputs[From] != dark and not self.blocks(From):
+                mix(outputs, self.dirFrom[From], rgb.channels[effect[rgb.pack(inputs[From])]])
+        return outputs
+
+    def configuration(self) -> tuple:
+        """Glass transfer also depends on its type and potency."""
+        return super().configuration() + (self.type, self.potency)
+
+    def compileTransfer(self) -> table:
+        """Glass routes its open sides straight through its amplification or attenuation table."""
+        effect= rgb.attenuated[self.potency] if self.type == 1 else rgb.amplified[self.potency]
+        return table([() if self.blocks(From) else ((self.dirFrom[From], effect),) for From in range(4)])
+
+    def editProperty(self, index, changing):
+        """
+        Edit glass properties in the level editor.
+
+        Args:
+            index: Property value to set (0=toggle type, other values=set potency)
+            changing: Property type selector (unused for glass)
+
+        Returns:
+            True if property was changed, False otherwise
+        """
+        if index is not None:
+            if index == 0:
+                # Toggle between light glass (0) and dark glass (1)
+                self.type = int(not bool(self.type))
+            else:
+                # Set potency value (strength of light modification)
+                self.potency = index
+            return True
+        else:
+            return False
+
+    def getData(self, pocket=False):
+        """
+        Serialize glass data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current glass state for level saving
+
+        Returns:
+            Dictionary containing glass type and configuration data
+        """
+        # Get base cell data from parent class
+        data= super().getData()
+
+        if pocket:
+            # Return template data for level editor (preserves type and potency)
+            data["data"]= {
+                "direction": 0,           # Default rotation
+                "type": self.type,        # Current glass type (light/dark)
+                "potency": self.potency   # Current potency setting
+            }
+            return data
+
+        # Return current glass state data for level saving
+        data["data"]= {
+            "direction": self.direction,  # Current rotation direction
+            "type": self.type,            # Current glass type (0=light, 1=dark)
+            "potency": self.potency       # Current potency value
+        }
+        return data
+
+    def visualState(self) -> tuple:
+        """Glass appearance also depends on its type and potency."""
+        return super().visualState() + (self.type, self.potency)
+
+class final(default):
+    """
+    Final model that serves as the goal/target for light puzzles.
+    Features two modes:
+    - Final mode: Requires exact RGB color match to complete the level
+    - Filter mode: Subtracts its color values from passing light and allows light through
+    """
+
+    __slots__= ("color", "isCompleated")
+
+    # Type code stored in the board's kind array
+    code= kinds.final
+    # Completion is kept outside the grid arrays (a dark beam completes a (0,0,0) target without lighting the cell)
+    keepsLight= True
+    # Decides whether the level is completed
+    goal= True
+
+    def __init__(self, xy: tuple[int, int]|None = None, name: str = "F", layout=None, data=None, **kwargs):
+        """
+        Initialize a final/goal cell with target color requirements.
+
+        Args:
+            xy: Grid coordinates (x,y) where the final cell is placed
+            name: Cell identifier/name for the final cell
+            layout: Grid layout information (unused for final cells)
+            data: Dictionary with direction, final mode (True/False), and target color
+        """
+        # Set default configuration if none provided
+        if data is None:
+            data = {"direction": 0, "final": True, "color": (0,0,0)}
+
+        # Ensure final mode property exists
+        if "final" not in data:
+            data["final"]= True
+
+        # Ensure color property exists
+        if "color" not in data:
+            data["color"]= (0,0,0)
+
+        # Configure blocking behavior based on mode
+        if data["final"]:
+            breaks= [0,2,3]  # Block light from top, bottom, and left (only accept from right)
+        else:
+            breaks= [0,2]    # Block light from top and bottom (allow left-right passage)
+
+        # Store final cell properties
+        self.color= data["color"]      # Target RGB color that must be matched
+        self.isCompleated= False       # Tracks whether the puzzle goal has been achieved
+
+        super().__init__(xy= xy, name= name, breaks=breaks, layout= layout, data= data)
+        self.final= data["final"]      # True = final mode, False = filter mode (kept in the state arrays)
+
+    def editProperty(self, index:int, changing:int):
+        """
+        Edit the target RGB color value for a specific channel in the level editor.
+
+        Args:
+            index: Intensity value for the channel (0=max/10, None=off/0, 1-9=that value)
+            changing: Which RGB channel to modify (R=0, G=1, B=2)
+
+        Returns:
+            True indicating the property edit was successful
+        """
+        # Handle intensity value mapping
+        if index is not None:
+            if index == 0:
+                index = 10  # Special case: 0 maps to maximum intensity (10)
+            # Update the specified color channel
+            current = list(self.color)
+            current[changing] = index
+            self.color = tuple(current)
+        else:
+            # Set channel to off (0 intensity)
+            current = list(self.color)
+            current[changing] = 0
+            self.color = tuple(current)
+        return True
+
+    def changeLight(self, From=None, color=None):
+        """
+        Process incoming light and check for puzzle completion.
+        Behavior depends on mode: final mode checks for exact color match,
+        filter mode subtracts color values and passes remaining light through.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB color tuple of the incoming light
+
+        Returns:
+            Tuple of (output_light_dict, light_blocked_bool)
+        """
+        # Reset completion status at start of each light processing
+        self.isCompleated= False
+
+        # Set default color if none provided
+        if color is None:
+            color= (0,0,0)
+
+        # FINAL MODE: Check for exact color match to complete puzzle
+        if self.final and From == self.convDir(1):  # Light coming from the right (input direction)
+            # Check if incoming light exactly matches target color
+            if color[0] == self.color[0] and color[1] == self.color[1] and color[2] == self.color[2]:
+                self.isCompleated= True
+
+        # FILTER MODE: Process light passing through horizontally with color subtraction
+        elif not self.final and (From == self.convDir(1) or From == self.convDir(3)):  # Light from left or right
+            # Store incoming light from this direction
+            self.inputs[From]= color
+
+            # Calculate combined light for display (bidirectional flow)
+            # Add light from both directions, but subtract target color from the opposite direction
+            right, left, target= self.inputs.packed(self.convDir(1)), self.inputs.packed(self.convDir(3)), rgb.pack(self.color)
+            color1= rgb.channels[rgb.add(right, rgb.subtract(left, target))]
+            color3= rgb.channels[rgb.add(left, rgb.subtract(right, target))]
+
+            # Update beam states for both horizontal directions
+            self.changeBeamStates(beamDirs=[self.convDir(1)], color= color1)
+            self.changeBeamStates(beamDirs=[self.convDir(3)], color= color3)
+
+            # Calculate output light (subtract target color from input, minimum 0)
+            output= rgb.channels[rgb.subtract(rgb.pack(color), target)]
+
+            # Calculate total combined light intensity for completion check
+            combined_color= rgb.add(right, left)
+
+            # Check if combined light meets or exceeds target requirements
+            if rgb.reaches[combined_color * rgb.size + target]:
+                self.isCompleated= True
+
+            # Return filtered light output or block if no light remains
+            if output != (0,0,0):
+                return {self.dirFrom[From]:output}, False  # Pass filtered light to opposite direction
+            else:
+                return {}, True  # No light output, effectively blocked
+
+        # Default case: handle other light interactions normally (will likely be blocked)
+        return super().changeLight(From, color)
+
+    def restart(self):
+        """Reset the final to its unlit state, which is not completed."""
+        self.isCompleated= False
+        return super().restart()
+
+    def cleared(self):
+        """The board cleared the final's light, so it is not completed any more."""
+        self.isCompleated= False
+
+    @property
+    def final(self) -> bool:
+        """Mode (True=final, False=filter), stored in the grid's flipped array."""
+        return bool(self.slot.grid.flipped[self.slot.y, self.slot.x])
+
+    @final.setter
+    def final(self, final:bool):
+        self.slot.grid.flipped[self.slot.y, self.slot.x]= final
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Finals absorb light, filters pass it left-right minus their color."""
+        outputs= {}
+        if not self.final:
+            for From in [self.convDir(1), self.convDir(3)]:
+                if inputs[From] != dark:
+                    output= rgb.channels[rgb.subtract(rgb.pack(inputs[From]), rgb.pack(self.color))]
+                    if output != dark:
+                        mix(outputs, self.dirFrom[From], output)
+        return outputs
+
+    def configuration(self) -> tuple:
+        """Final transfer also depends on its mode and target color."""
+        return super().configuration() + (self.final, tuple(self.color))
+
+    def compileTransfer(self) -> table:
+        """Finals absorb light, filters route left-right through a subtraction of their color."""
+        routes= [(), (), (), ()]
+        if not self.final:
+            target= rgb.pack(self.color)
+            effect= [rgb.subtracted[color * rgb.size + target] for color in range(rgb.size)]
+            for From in [self.convDir(1), self.convDir(3)]:
+                routes[From]= ((self.dirFrom[From], effect),)
+        return table(routes)
+
+    def settle(self, inputs, source:bool=False):
+        """
+        Set beam states from the final incoming light, then evaluate completion from all
+        inputs at once (independent of the order the sides were fed in).
+        """
+        super().settle(inputs, source)
+        right, left= inputs[self.convDir(1)], inputs[self.convDir(3)]
+        if self.final:
+            # Final mode: the light entering from the right must match exactly
+            self.isCompleated= right != dark and all(right[i] == self.color[i] for i in range(3))
+        else:
+            # Filter mode: light from both sides together must reach the target
+            combined= rgb.add(rgb.pack(right), rgb.pack(left))
+            self.isCompleated= (right != dark or left != dark) and bool(rgb.reaches[combined * rgb.size + rgb.pack(self.color)])
+
+    def flip(self):
+        """
+        Toggle between final mode and filter mode.
+
+        Returns:
+            True indicating the flip operation was successful
+        """
+        # Toggle between final mode (True) and filter mode (False)
+        self.final= not self.final
+        return True
+
+    def getData(self, pocket= False):
+        """
+        Serialize final cell data for saving/loading levels.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current final cell state for level saving
+
+        Returns:
+            Dictionary containing final cell type and configuration data
+        """
+        # Get base cell data from parent class
+        data= super().getData()
+
+        # Return current final cell state data (same for both pocket and save)
+        data["data"]= {
+            "direction": self.direction,  # Current rotation direction
+            "final": self.final,          # Current mode (True=final, False=filter)
+            "color": self.color           # Target RGB color values
+        }
+        return data
+
+    def visualState(self) -> tuple:
+        """Final appearance also depends on its mode, target color and status LED."""
+        return super().visualState() + (self.final, tuple(self.color), self.isCompleated)
+
+class level(default):
+    """
+    Level selector model for the game map.
+    Manages level unlocking, state tracking, and the light it emits when unlocked.
+    Supports conditional unlocking based on light inputs and AND/OR logic.
+    """
+
+    __slots__= ("andOr", "state", "unlocksWith", "levelID", "stateChanger", "next")
+
+    # Type code stored in the board's kind array
+    code= kinds.level
+    # Fired as a light source
+    emitter= True
+
+    def __init__(self, data= None, **kwargs):
+        """
+        Initialize a level selector with unlock conditions.
+
+        Args:
+            data: Dictionary containing level configuration:
+                - state: Level accessibility (0=locked, 1=unlocked, 2=current/active)
+                - unlocksWith: Number of light inputs required to unlock
+                - level: Unique level identifier string
+                - next: Dictionary mapping directions to output light colors
+        """
+        # Initialize unlock logic mode (False = AND logic, True = OR logic)
+        self.andOr= False
+
+        # Set default data if none provided
+        if data is None:
+            data= {}
+
+        # Initialize level state (0=locked, 1=unlocked, 2=current)
+        if "state" not in data:
+            data["state"] = 1  # Default to unlocked
+        self.state = data["state"]
+
+        # Initialize unlock requirements
+        if "unlocksWith" not in data:
+            data["unlocksWith"] = 0  # Default: no inputs required to unlock
+        self.unlocksWith= data["unlocksWith"]
+
+        # Configure light blocking based on state
+        if self.state == 0:  # Locked state
+            breaks= [0,1,2,3]  # Block all light directions
+        else:  # Unlocked or current state
+            breaks= []       # Allow light through
+
+        # Generate or load level identifier
+        if "level" not in data:
+            self.levelID= str(uuid4())[:8]  # Generate 8-character unique ID
+        else:
+            self.levelID= data["level"]
+
+        # Track state changes for level editor
+        self.stateChanger= 0
+
+        # Initialize output light configuration
+        if "next" not in data:
+            data["next"] = {}
+        self.next= {}
+        # Convert string keys to integer directions for output mapping
+        for key, value in data["next"].items():
+            self.next[int(key)]= value
+
+        # Level selectors are always named "L" and have no rotation
+        super().__init__(name= "L", breaks=breaks, data= {})
+
+        if self.state == 1:
+            for i in self.next:
+                self.changeBeamStates(beamDirs=[i], color= self.next[i])
+
+    def changeLight(self, From=None, color=None):
+        """
+        Process incoming light and handle level unlocking logic.
+
+        Args:
+            From: Direction light is coming from (0=up, 1=right, 2=down, 3=left)
+            color: RGB color tuple of the incoming light
+
+        Returns:
+            Tuple of (output_light_dict, light_blocked_bool)
+        """
+        # Store incoming light from specified direction
+        if From is not None:
+            self.inputs[From]= color
+
+        # Check unlock conditions if level is currently locked and receiving light
+        if From is not None and color is not None and self.state == 0:
+            # Count number of active light inputs (non-black colors)
+            total= 0
+            for i in self.inputs:
+                if i != (0,0,0):
+                    total += 1
+
+            # Unlock level if sufficient inputs are received
+            if self.unlocksWith <= total:
+                self.state= 2        # Change to "current" state
+                self.breaks= []      # Remove light blocking
+
+        # Update beam states for all active inputs
+        for i in range(4):
+            if self.inputs[i] != (0,0,0):
+                # Update beam state for this direction
+                self.changeBeamStates(beamDirs=[i], color= self.inputs[i], breakA= False, breakB= False)
+                # Check if light should be blocked in this direction
+                self.checkBreak(i)
+
+        # Return appropriate output based on level state
+        if self.state == 0:
+            # Locked state: block all light
+            return {}, True
+        elif self.state == 1:
+            # Unlocked state: output configured light patterns
+            for i in self.next:
+                self.changeBeamStates(beamDirs=[i], color= self.next[i])
+            return self.next, False  # Pass through configured outputs
+        else:
+            # Current state (state == 2): block light (level is being played)
+            return {}, True
+
+    def transfer(self, inputs, source:bool=False) -> dict:
+        """Unlocked levels emit their configured outputs when fired or lit, other states absorb."""
+        if self.state == 1 and (source or any(color != dark for color in inputs)):
+            outputs= {}
+            for side, color in self.next.items():
+                mix(outputs, side, color)
+            return outputs
+        return {}
+
+    def configuration(self) -> tuple:
+        """Level transfer depends on its state and configured outputs."""
+        return super().configuration() + (self.state, tuple((side, tuple(color)) for side, color in sorted(self.next.items())))
+
+    def compileTransfer(self) -> table:
+        """Unlocked levels emit their configured outputs when fired or lit, other states absorb."""
+        if self.state == 1:
+            return table(emits={side: rgb.pack(color) for side, color in self.next.items() if tuple(color) != dark}, triggered=True)
+        return table()
+
+    def openLevel(self):
+        """
+        Get the level identifier for loading/opening this level.
+
+        Returns:
+            String containing the unique level ID
+        """
+        return self.levelID
+
+    def editProperty(self, index, changing):
+        """
+        Edit level properties in the level editor.
+
+        Args:
+            index: Property/action selector:
+                   0-3: Configure output direction colors
+                   4: Change level ID
+                   5: Set unlock state
+                   6: Set lock state
+                   7: Set AND logic mode
+                   8: Set OR logic mode
+                   9: Show help information
+            changing: Color selection for direction outputs (0=green, 1=blue, 2=red)
+
+        Returns:
+            True indicating the property edit was processed
+        """
+        # Handle special property changes
+        if index == 4:
+            # Change level identifier
+            self.levelID= input("New Level ID: ")
+            return True
+        if index == 5:
+            # Set to unlock state for saving
+            self.stateChanger= 2
+            return True
+        if index == 6:
+            # Set to lock state for saving
+            self.stateChanger= 0
+            return True
+        if index == 7:
+            # Set AND logic mode (all inputs required)
+            self.andOr= False
+            return True
+        if index == 8:
+            # Set OR logic mode (any input sufficient)
+            self.andOr= True
+            return True
+        if index == 9:
+            # Display help information
+            print("Inputs; 0,1,2,3: Direction, 4: LevelID, 5: Unlock, 6: Lock, 7: AND, 8: OR")
+
+        # Handle directional output configuration
+        # Available colors: green (0,10,0), blue (0,0,10), red (10,0,0)
+        color_options = [(0,10,0), (0,0,10), (10,0,0)]
+
+        if index in self.next:
+            # Toggle existing output direction (remove if same color selected)
+            if self.next[index] == color_options[changing]:
+                del self.next[index]
+            else:
+                self.next[index] = color_options[changing]
+        elif index in [0, 1, 2, 3]:
+            # Add new output direction with selected color
+            self.next[index] = color_options[changing]
+        return True
+
+    def getData(self, pocket= False):
+        """
+        Serialize level cell data for saving/loading levels.
+        Calculates unlock requirements based on current logic mode.
+
+        Args:
+            pocket: If True, returns template data for level editor palette
+                   If False, returns current level state for level saving
+
+        Returns:
+            Dictionary containing level type and configuration data
+        """
+        # Calculate unlock requirements based on logic mode
+        self.unlocksWith= 0
+        data= super().getData()
+
+        if self.andOr:
+            # OR logic: only one input needed
+            self.unlocksWith= 1
+        else:
+            # AND logic: count number of True inputs (debug print shows current inputs)
+            print(self.inputs)
+            for i in self.inputs:
+                if i == True:  # This seems to be checking boolean rather than color
+                    self.unlocksWith += 1
+
+        # Return level configuration data
+        data["data"]= {
+            "state": self.stateChanger,    # State to save (from editor changes)
+            "next": self.next,             # Output light directions and colors
+            "unlocksWith": self.unlocksWith,  # Number of inputs required to unlock
+            "level": self.levelID          # Unique level identifier
+        }
+        return data
+
+    def visualState(self) -> tuple:
+        """Level appearance also depends on its lock state."""
+        return super().visualState() + (self.state,)
+
+# Dictionary mapping cell type names to their pure models (same keys as cells.cells)
+# Used to build headless boards straight from level data
+models= {
+    "default": default,    # Base/empty cell (no special behavior)
+    "laser": laser,        # Configurable light source
+    "block": xblock,       # Light-blocking obstacle
+    "mirror": mirror,      # Light reflection with two orientations
+    "prism": prism,        # RGB light splitting/combining with flip modes
+    "glass": glass,        # Light intensity modification (amplify/attenuate)
+    "final": final,        # Level goal with exact match or filter modes
+    "level": level         # Menu level selector
+}
@@ -0,0 +1,75 @@
+# Packed colors: a game scale RGB color (0-10 per channel) stored as one int r*121 + g*11 + b
+# Every channel operation the beams need is precomputed once, so beam maths become table lookups
+from array import array  # Import compact typed arrays for the pair tables
+import numpy as np       # Import numpy to build the tables in one go
+
+# Number of values per channel and of packed colors
+levels= 11
+size= levels ** 3
+
+# Packed value of no light
+black= 0
+
+def pack(color) -> int:
+    """Pack a game scale (r, g, b) color into one int."""
+    return color[0] * 121 + color[1] * 11 + color[2]
+
+# Unpack table: packed color -> (r, g, b)
+channels= [(packed // 121, packed // 11 % 11, packed % 11) for packed in range(size)]
+
+# Every packed color split into its channels, as a numpy array for building the tables
+split= np.array(channels, np.int16)
+
+def pairTable(operation) -> np.ndarray:
+    """
+    Build a table of an operation over every pair of packed colors, indexed a * size + b.
+
+    Args:
+        operation: Per channel function of two arrays of channel values (0-10), returning values 0-10
+
+    Returns:
+        Flat array of the packed results
+    """
+    # The operation works channel by channel, so an 11x11 table per channel is enough to build it
+    values= np.arange(levels, dtype=np.int16)
+    channel= operation(values[:, None], values[None, :]).astype(np.uint16)
+    result= channel[split[:, None, 0], split[None, :, 0]] * 121
+    result+= channel[split[:, None, 1], split[None, :, 1]] * 11
+    result+= channel[split[:, None, 2], split[None, :, 2]]
+    return result.ravel()
+
+# Saturating add of two colors (light meeting in a cell)
+added= array("H", pairTable(lambda a, b: np.minimum(10, a + b)).tobytes())
+# Filter subtraction (light minus a filter's color, floored at 0)
+subtracted= array("H", pairTable(lambda a, b: np.maximum(0, a - b)).tobytes())
+# True where every channel of a reaches the one of b (filter completion)
+reaches= array("B", (pairTable(lambda a, b: a >= b) == pack((1, 1, 1))).astype(np.uint8).tobytes())
+
+def packAll(values) -> list[int]:
+    """Pack an (n, 3) channel array into a list of packed colors."""
+    return (values[:, 0] * 121 + values[:, 1] * 11 + values[:, 2]).tolist()
+
+def glassTable(sign:int) -> list[list[int]]:
+    """Glass effect per potency (0-10): lit channels move by sign * potency, clamped to 0-10."""
+    return [packAll(np.clip(split + sign * potency * (split > 0), 0, 10)) for potency in range(levels)]
+
+# Light glass amplification and dark glass attenuation: table[potency][packed]
+amplified= glassTable(1)
+attenuated= glassTable(-1)
+# How far every lit channel falls short of a dark glass potency (what attenuation floors away): table[potency][packed]
+shortfall= [packAll(np.maximum(0, potency * (split > 0) - split)) for potency in range(levels)]
+
+# Single channel of every color: parts[channel][packed] keeps only that channel (split by prisms)
+parts= [packAll(split * (np.arange(3) == i)) for i in range(3)]
+
+def add(a:int, b:int) -> int:
+    """Saturating add of two packed colors."""
+    return added[a * size + b]
+
+def subtract(a:int, b:int) -> int:
+    """Packed color a minus packed color b, per channel, floored at 0."""
+    return subtracted[a * size + b]
+
+def merge(red:int, green:int, blue:int) -> int:
+    """Packed color taking its red, green and blue channel from three packed colors (prism combine)."""
+    return parts[0][red] + parts[1][green] + parts[2][blue]
@@ -0,0 +1,14 @@
+# Color scales: the light models work in game scale (0-10 per channel), drawing uses display scale (0-255)
+# The conversion is a precomputed table, so it is a lookup and only happens at render time
+from . import rgb  # Import packed colors (beam colors are stored packed)
+
+# Display value of every game value: intensity = (value/1.428571 + 3*bool(value)) * 25.5
+# This keeps 0 at 0 but starts 1 at 94, scaling up to 10 at 255 so dim light stays visible
+levels= [int((value/1.428571+3*int(bool(value)))*25.5) for value in range(rgb.levels)]
+
+# Display color of every packed game color
+packed= [tuple(levels[c] for c in color) for color in rgb.channels]
+
+def display(color) -> tuple[int, int, int]:
+    """Convert a color from game scale (0-10) to display scale (0-255)."""
+    return packed[rgb.pack(color)]
@@ -0,0 +1,192 @@
+# Array-backed light state of a board: one typed array per property instead of per-cell Python objects
+# Cells keep working as before through thin views that read and write their slot of the arrays
+from collections.abc import Mapping, Sequence  # Import abstract bases so views act like the lists/dicts they replace
+import numpy as np  # Import numpy for the typed state arrays
+from . import rgb   # Import packed colors (inputs are stored packed)
+
+class grid():
+    """
+    Typed arrays holding the state of every cell on a board, indexed [y, x].
+    Every cell starts on a private 1x1 grid and is bound to the board's grid
+    once the board picks it up, so cells work the same on and off a board.
+    """
+
+    def __init__(self, width:int, height:int):
+        """
+        Args:
+            width, height: Grid size in cells
+        """
+        self.width = width
+        self.height = height
+        # Cell type code (see engine.optics.kinds)
+        self.kind = np.zeros((height, width), np.uint8)
+        # Rotation (0-3)
+        self.direction = np.zeros((height, width), np.uint8)
+        # Flip state (prism flipped, final cell in final mode)
+        self.flipped = np.zeros((height, width), np.bool_)
+        # Light entering each side (up, right, down, left), packed game scale colors (see engine.rgb)
+        self.inputs = np.zeros((height, width, 4), np.uint16)
+        # Beam colors shown on each side, packed game scale colors (up/down = vertical A/B, right/left = horizontal A/B)
+        # Drawing converts them to display scale (see engine.scale)
+        self.beams = np.zeros((height, width, 4), np.uint16)
+        # Beam break flags [horizontal, vertical][A, B]
+        self.breaks = np.zeros((height, width, 2, 2), np.bool_)
+        # Cells keeping light state outside these arrays (see engine.optics.default.keepsLight)
+        self.keeps = np.zeros((height, width), np.bool_)
+        # Cell bound to every slot (None while a slot was never bound)
+        self.cells = [[None] * width for _ in range(height)]
+        # Registries kept up to date as cells are bound (see place()): positions of the cells
+        # emitting light when fired (lasers, level selectors) and of the goal cells (finals)
+        self.emitters = set()
+        self.goals = set()
+
+    def place(self, cell, x:int, y:int):
+        """
+        Record the cell bound to (x, y) and file the position under the registries it belongs to.
+
+        Args:
+            cell: Cell bound to the position (None if the position was left empty)
+            x, y: Position in the grid
+        """
+        self.cells[y][x] = cell
+        for registry, member in [(self.emitters, cell is not None and cell.emitter), (self.goals, cell is not None and cell.goal)]:
+            if member:
+                registry.add((x, y))
+            else:
+                registry.discard((x, y))
+
+    def reset(self):
+        """Clear the light of every cell at once (inputs, beam colors and break flags)."""
+        self.inputs.fill(0)
+        self.beams.fill(0)
+        self.breaks.fill(False)
+
+    def lit(self) -> np.ndarray:
+        """Boolean [y, x] mask of cells receiving light or showing any beam or break flag."""
+        return self.inputs.any(axis=2) | self.beams.any(axis=2) | self.breaks.any(axis=(2, 3))
+
+    @staticmethod
+    def inRows(positions) -> list[tuple[int, int]]:
+        """Positions (x, y) sorted in row order."""
+        return sorted(positions, key=lambda position: (position[1], position[0]))
+
+class sides(Sequence):
+    """
+    View of the four colors entering a cell (up, right, down, left), used as cell.inputs.
+    Reads give tuples of ints like the list of tuples it replaces.
+    """
+
+    __slots__ = ("cell",)
+
+    def __init__(self, cell):
+        self.cell = cell
+
+    def __getitem__(self, side):
+        slot = self.cell.slot
+        if isinstance(side, slice):
+            return [rgb.channels[packed] for packed in slot.grid.inputs[slot.y, slot.x, side].tolist()]
+        return rgb.channels[int(slot.grid.inputs[slot.y, slot.x, side])]
+
+    def __setitem__(self, side, color):
+        slot = self.cell.slot
+        slot.grid.inputs[slot.y, slot.x, side] = rgb.pack(color)
+
+    def packed(self, side:int) -> int:
+        """Packed color entering a side (no tuple built)."""
+        slot = self.cell.slot
+        return int(slot.grid.inputs[slot.y, slot.x, side])
+
+    def __len__(self):
+        return 4
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def copy(self) -> list:
+        """Detached list of the four colors."""
+        return list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+class beamState(Mapping):
+    """
+    View of one beam axis of a cell, used as cell.stateX (horizontal) and cell.stateY (vertical).
+    Acts like the {"colorA", "colorB", "breakA", "breakB", "vertical"} dictionary it replaces.
+    """
+
+    __slots__ = ("cell", "vertical", "sides")
+
+    # Keys in their original order
+    order = ("colorA", "colorB", "breakA", "breakB", "vertical")
+
+    def __init__(self, cell, vertical:bool):
+        self.cell = cell
+        self.vertical = vertical
+        # Sides holding colorA and colorB of this axis
+        self.sides = (0, 2) if vertical else (1, 3)
+
+    def __getitem__(self, key):
+        slot = self.cell.slot
+        match key:
+            case "colorA":
+                return rgb.channels[int(slot.grid.beams[slot.y, slot.x, self.sides[0]])]
+            case "colorB":
+                return rgb.channels[int(slot.grid.beams[slot.y, slot.x, self.sides[1]])]
+            case "breakA":
+                return bool(slot.grid.breaks[slot.y, slot.x, int(self.vertical), 0])
+            case "breakB":
+                return bool(slot.grid.breaks[slot.y, slot.x, int(self.vertical), 1])
+            case "vertical":
+                return self.vertical
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        slot = self.cell.slot
+        match key:
+            case "colorA":
+                slot.grid.beams[slot.y, slot.x, self.sides[0]] = rgb.pack(value)
+            case "colorB":
+                slot.grid.beams[slot.y, slot.x, self.sides[1]] = rgb.pack(value)
+            case "breakA":
+                slot.grid.breaks[slot.y, slot.x, int(self.vertical), 0] = value
+            case "breakB":
+                slot.grid.breaks[slot.y, slot.x, int(self.vertical), 1] = value
+            case "vertical":
+                pass
+            case _:
+                raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def copy(self) -> dict:
+        """Detached dictionary of the beam state."""
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+class slot():
+    """
+    Position of one cell in a grid. Cells index the grid arrays at [y, x] through it
+    instead of keeping numpy views, which cost more memory than the cell itself.
+    """
+
+    __slots__ = ("grid", "x", "y")
+
+    # Per cell arrays of a grid (copied when a cell moves to another grid)
+    arrays = ("kind", "direction", "flipped", "keeps", "inputs", "beams", "breaks")
+
+    def __init__(self, state:grid, x:int, y:int):
+        self.grid = state
+        self.x = x
+        self.y = y
+
+    def copy(self, target:"slot"):
+        """Copy the state of this position into another grid position."""
+        for name in self.arrays:
+            getattr(target.grid, name)[target.y, target.x] = getattr(self.grid, name)[self.y, self.x]
@@ -0,0 +1,78 @@
+# Superposed light: every source is traced on its own, as if it were the only one on the board,
+# and the light of all sources is added up where it meets (engine.rgb saturating add).
+# A source's contribution only depends on the cells its light reaches, so it stays valid until
+# one of those cells changes, and an edit retraces the sources touching it instead of all of them.
+# Lasers do not interact this way: a glass or filter hit by two lasers changes each beam on its own
+# instead of their sum, finals and beam states still see the summed light.
+from . import rgb, transfer  # Import packed colors and compiled transfer tables
+
+def trace(board, x:int, y:int) -> dict:
+    """
+    Light one source alone with the compiled transfer tables and collect what enters every side.
+    A side is only ever lit along one ray (from the nearest non-empty cell in that direction),
+    so a cell is evaluated again only when the light it sends out changes, and each change is
+    written straight into the sides it reaches. Unlit level selectors reached by the light are
+    not triggered (they are fired as sources of their own).
+
+    Args:
+        board: Board being solved (its step budget and ray-skip index apply)
+        x, y: Grid position of the source
+
+    Returns:
+        Dictionary of (x, y) -> four packed colors entering from up, right, down and left
+        (every position the light reached, empty cells included)
+    """
+    source = (x, y)
+    arrivals = {}
+    # Light every evaluated cell sends out, by side
+    sent = {}
+    # Cells whose incoming light changed, evaluated last in first out (depth first, like the trace mode)
+    pending = [source]
+    queued = {source}
+    while pending:
+        x, y = position = pending.pop()
+        queued.discard(position)
+        if not board.step():
+            break
+        outputs = transfer.lookup(board.layout[y][x]).apply(arrivals.get(position, transfer.unlit), position == source, trigger=False)
+        previous = sent.get(position, {})
+        sent[position] = outputs
+        for Dir in set(outputs) | set(previous):
+            color = outputs.get(Dir, rgb.black)
+            if previous.get(Dir, rgb.black) == color:
+                continue
+            # Calculate direction vectors: Up=0, Right=1, Down=2, Left=3 (same as board.propagate)
+            dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
+            From = [2, 3, 0, 1][Dir]
+            landX, landY, run = board.skips[Dir][y][x]
+            if not board.step(run):
+                pending.clear()
+                break
+            reached = [(x + dx * k, y + dy * k) for k in range(1, run + 1)]
+            if landX is not None:
+                reached.append((landX, landY))
+            for lit in reached:
+                arrivals.setdefault(lit, [rgb.black] * 4)[From] = color
+            # The cell ending the run sees different light, evaluate it again
+            if landX is not None and (landX, landY) not in queued:
+                pending.append((landX, landY))
+                queued.add((landX, landY))
+    # Sides a source lit and later darkened are left out
+    return {position: sides for position, sides in arrivals.items() if any(sides)}
+
+def combine(contributions:list) -> list[int]:
+    """
+    Add up the light several sources send into one position.
+
+    Args:
+        contributions: Four packed colors per source (up, right, down, left)
+
+    Returns:
+        Four packed colors, each side saturating at 10 per channel
+    """
+    total = [rgb.black] * 4
+    for sides in contributions:
+        for From in range(4):
+            if sides[From]:
+                total[From] = rgb.added[total[From] * rgb.size + sides[From]]
+    return total
@@ -0,0 +1,70 @@
+# Compiled light transfer: for a given cell type and configuration (direction, flip state, potency,
+# target color...) a cell maps the light entering each side to the light leaving it in a fixed way,
+# so it is compiled once into routes and packed color tables (see engine.rgb) the solvers can apply directly
+from . import rgb  # Import packed colors and their lookup tables
+
+# Four unlit sides, packed
+unlit= (rgb.black,) * 4
+
+class table():
+    """
+    Compiled transfer of one cell configuration, working on packed colors.
+    Built by the models (see engine.optics.default.compileTransfer) and shared by every
+    cell with the same configuration.
+    """
+
+    def __init__(self, routes:list[tuple]|None=None, combine:tuple|None=None, emits:dict|None=None, triggered:bool=False):
+        """
+        Args:
+            routes: For each entry side (up, right, down, left), a tuple of (exit side, effect) pairs.
+                    The effect maps every packed color to the packed color leaving (None leaves it unchanged)
+            combine: (main side, (red side, green side, blue side)) for cells sending one channel of
+                     every channel side out through the main side (prisms), None otherwise
+            emits: Dictionary of side -> packed color sent out when the cell is fired
+            triggered: True if the cell also emits when any side is lit (unlocked level selectors)
+        """
+        self.routes = routes if routes is not None else [(), (), (), ()]
+        self.combine = combine
+        self.emits = emits if emits is not None else {}
+        self.triggered = triggered
+
+    def apply(self, inputs, source:bool=False, trigger:bool=True) -> dict:
+        """
+        Light leaving every side for the light entering every side.
+
+        Args:
+            inputs: Four packed colors entering from up, right, down and left
+            source: True if the cell is fired as a light source this run
+            trigger: False to keep lit triggered cells from emitting (they only emit as sources)
+
+        Returns:
+            Dictionary of side -> packed color leaving through that side (unlit sides left out)
+        """
+        outputs = {}
+        if self.emits and (source or (trigger and self.triggered and any(inputs))):
+            outputs.update(self.emits)
+        for From in range(4):
+            color = inputs[From]
+            if color:
+                for side, effect in self.routes[From]:
+                    out = color if effect is None else effect[color]
+                    if out:
+                        # Beams sharing the same side add up per channel, saturating at 10
+                        outputs[side] = rgb.added[outputs[side] * rgb.size + out] if side in outputs else out
+        if self.combine is not None:
+            main, (red, green, blue) = self.combine
+            out = rgb.merge(inputs[red], inputs[green], inputs[blue])
+            if out:
+                outputs[main] = rgb.added[outputs[main] * rgb.size + out] if main in outputs else out
+        return outputs
+
+# Compiled tables of every configuration seen so far, keyed by the models' configuration()
+compiled = {}
+
+def lookup(cell) -> table:
+    """Compiled transfer table of a cell, built on first use of its configuration."""
+    key = cell.configuration()
+    found = compiled.get(key)
+    if found is None:
+        found = compiled[key] = cell.compileTransfer()
+    return found
@@ -8,6 +8,11 @@ from cells.level import level
 cells["level"]= level
 
 class levelMaker(LightHackGame):
+    # Editing never completes the level
+    winnable = False
+    # The cell palette gets a layer of its own, below overlays
+    layerOrder = ("highlight", "board", "pocket", "palette", "info")
+
     def __init__(self):
         super().__init__()
         self.changing= 0
@@ -17,9 +22,9 @@ class levelMaker(LightHackGame):
     def placeCell(self, x: int, y: int, overlay=False):
         if self.complexLayout[y][x] is not None:
             if (x, y) in self.toPocket[0]:
-                self.gameDisplay.blit(multiply(self.complexLayout[y][x].render(scale=(self.cellSize,self.cellSize), overlay=overlay), (255,180,180)), (x*self.cellSize + self.offsetX, y*self.cellSize + self.offsetY))
+                self.placeSprite(x, y, multiply(self.complexLayout[y][x].render(size=(self.cellSize,self.cellSize), overlay=overlay), (255,180,180)), overlay)
             else:
-                self.gameDisplay.blit(self.complexLayout[y][x].render(scale= (self.cellSize,self.cellSize), overlay=overlay), (x*self.cellSize + self.offsetX, y*self.cellSize + self.offsetY))
+                self.placeSprite(x, y, self.complexLayout[y][x].render(size=(self.cellSize,self.cellSize), overlay=overlay), overlay)
 
     def makeId(self, name, IDs):
         for i in range(100):
@@ -46,14 +51,18 @@ class levelMaker(LightHackGame):
                 json.dump(self.levelData, f, indent=4)
         super().load(level, texts=[""])
 
+    def redraw(self):
+        super().redraw()
+        self.drawSelectedCells()
+
     def drawSelectedCells(self):
         availableCells= cells.copy()
         availableCells.pop("default")
         for i, cell in enumerate(availableCells):
-            self.gameDisplay.blit(self.background, (i * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
-            if i == self.selectedCell:
-                self.gameDisplay.blit(self.highlight, (i * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
-            self.gameDisplay.blit(cells[cell]().render(), (i * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
+            self.layers.put("palette", ("back", i), self.background, (i * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
+        self.layers.put("palette", "selected", self.highlight, (self.selectedCell * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
+        for i, cell in enumerate(availableCells):
+            self.layers.put("palette", ("cell", i), cells[cell]().render(), (i * self.cellSize + self.offsetX, self.levelData["height"] * self.cellSize + self.offsetY))
 
     def keyHandler(self, event):
         mouseX, mouseY = pygame.mouse.get_pos()
@@ -92,6 +101,7 @@ class levelMaker(LightHackGame):
                     else:
                         self.toPocket[0].append((x, y))
                         self.toPocket[1].append(self.complexLayout[y][x])
+                    self.board.invalidate((x, y))
                     self.calculate()
                 return "continue"
             
@@ -232,13 +242,10 @@ class levelMaker(LightHackGame):
                         if x >= 0 and y >= 0 and x < self.levelData["width"] and y < self.levelData["height"] and self.simpleLayout[y][x] != "D":
                             index = num - pygame.K_0
                             if self.complexLayout[y][x].editProperty(index, self.changing):
-                                try:
-                                    self.calculate()
-                                except RecursionError:
-                                    print("Recursion Error")
+                                if self.calculate().exhausted:
+                                    print("Light loop: step budget reached")
                             return "continue"
 
-        self.finals= [cells["final"](data={"color":(11,11,11), "direction":0})]
         super().keyHandler(event)
         return "continue"
 
@@ -2,6 +2,9 @@ from play import LightHackGame
 import pygame
 from cells import cells
 from cells.level import level
+from cells.texturing import cache
+from compositor import compositor
+from engine import board, kinds
 import json
 from screeninfo import get_monitors
 
@@ -32,19 +35,19 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
         darken= pygame.Surface((self.min_width - 66, self.min_height - 66))
         darken.set_alpha(100)
         darken.fill((0,0,0))
-        self.gameDisplay.blit(darken, (33,33))
+        self.layers.put("info", "darken", darken, (33,33))
         #Write "Light Hack" in the middle of the screen
         font= pygame.font.Font(None, 100)
         text1= font.render("Light Hack", True, (50,200,255))
-        self.gameDisplay.blit(text1, (self.min_width//2 - text1.get_width()//2 + self.offsetX, self.min_height//2 - text1.get_height()//2 - 100 + self.offsetY))
+        self.layers.put("info", "title", text1, (self.min_width//2 - text1.get_width()//2 + self.offsetX, self.min_height//2 - text1.get_height()//2 - 100 + self.offsetY))
         #Write "Click to Play" below
         text2= font.render("Click to Play", True, (50,200,255))
-        self.gameDisplay.blit(text2, (self.min_width//2 - text2.get_width()//2 + self.offsetX, self.min_height//2 - text2.get_height()//2 + self.offsetY))
-        pygame.display.update()
+        self.layers.put("info", "click", text2, (self.min_width//2 - text2.get_width()//2 + self.offsetX, self.min_height//2 - text2.get_height()//2 + self.offsetY))
+        self.present()
         # Wait for a click to continue
 
         while True:
-            for event in pygame.event.get():
+            for event in self.frames.wait():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -61,35 +64,22 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
                     self.lastWidth, self.lastHeight = self.gameDisplay.get_size()
                     self.offsetX = (self.lastWidth - self.min_width) // 2 + 33
                     self.offsetY = (self.lastHeight - self.min_height) // 2 + 33
-                    self.makeGradient()
-                    self.makeBorder()
-                    for y in range(self.levelData["height"]):
-                        for x in range(self.levelData["width"]):
-                            self.placeBack(x, y)
-                            self.placeCell(x, y)
+                    self.redraw()
 
-                    self.gameDisplay.blit(darken, (self.offsetX, self.offsetY))
-                    self.gameDisplay.blit(text1, (self.min_width//2 - text1.get_width()//2 + self.offsetX, self.min_height//2 - text1.get_height()//2 - 100 + self.offsetY))
-                    self.gameDisplay.blit(text2, (self.min_width//2 - text2.get_width()//2 + self.offsetX, self.min_height//2 - text2.get_height()//2 + self.offsetY))
+                    self.layers.put("info", "darken", darken, (self.offsetX, self.offsetY))
+                    self.layers.put("info", "title", text1, (self.min_width//2 - text1.get_width()//2 + self.offsetX, self.min_height//2 - text1.get_height()//2 - 100 + self.offsetY))
+                    self.layers.put("info", "click", text2, (self.min_width//2 - text2.get_width()//2 + self.offsetX, self.min_height//2 - text2.get_height()//2 + self.offsetY))
 
-                    pygame.display.update()
+                    self.present()
+            self.frames.done()
         
     def calculate(self):
-        for y in range(len(self.complexLayout)):
-            for x in range(len(self.complexLayout[0])):
-                self.complexLayout[y][x].restart()
+        # Only the starting level selectors ("L0", registered by load()) emit light in the menu
+        result= self.board.simulate(self.starts)
+        self.placeCells(result.changed)
 
-        for y in range(len(self.complexLayout)):
-            for x in range(len(self.complexLayout[0])):
-                if self.simpleLayout[y][x] == "L0":
-                    newLights, rtrn = self.complexLayout[y][x].changeLight()
-                    if rtrn is not True:
-                        for Dir, color in newLights.items():
-                            self.beam(x, y, Dir, color)
-                self.placeBack(x, y)
-                self.placeCell(x, y)
-
-        pygame.display.update()
+        self.present()
+        return result
 
     def keyHandler(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -97,7 +87,7 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
             x, y = (mouseX - self.offsetX) // self.cellSize, (mouseY - self.offsetY) // self.cellSize
             if event.button == 1:
                 if x >= 0 and y >= 0 and x < self.levelData["width"] and y < self.levelData["height"]:
-                    if self.complexLayout[y][x].name == "L":
+                    if self.complexLayout[y][x].code == kinds.level:
                         if self.complexLayout[y][x].state in [1, 2]:
                             lvl= self.complexLayout[y][x].openLevel()
                             if lvl[0] == "t":
@@ -127,6 +117,19 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
 
         return False
 
+    def paintChrome(self, target):
+        # The menu has no separator or texts: gradient, border and cell backgrounds only
+        target.fill((0, 75, 85))
+        self.makeGradient(target)
+        self.makeBorder(target)
+        for y in range(self.levelData["height"]):
+            for x in range(self.levelData["width"]):
+                target.blit(self.background, self.cellPosition(x, y))
+
+    def drawPocketCells(self):
+        # The menu has no inventory panel
+        pass
+
     def load(self, levelName, startSize=(0, 0)):
         try:
             self.levelData = json.load(open(f"levels/{levelName}.json", "r"))
@@ -148,11 +151,11 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
         self.gameDisplay = pygame.display.set_mode((max(self.min_width, startSize[0]), max(self.min_height, startSize[1])), pygame.RESIZABLE)
         pygame.display.set_caption(f"Light Hack")
         # Load and scale background textures
-        self.borderC = pygame.image.load("assets/border/corner.png").convert_alpha()
-        self.borderS = pygame.image.load("assets/border/side.png").convert_alpha()
-        self.background = pygame.image.load("assets/background.png")
+        self.borderC = cache.get("border/corner.png")
+        self.borderS = cache.get("border/side.png")
+        self.background = cache.get("background.png")
         self.background = pygame.transform.scale(self.background, (self.cellSize, self.cellSize))
-        self.highlight = pygame.image.load("assets/menu/highlight.png").convert_alpha()
+        self.highlight = cache.get("menu/highlight.png")
         self.highlight = pygame.transform.scale(self.highlight, (self.cellSize, self.cellSize))
         self.lastWidth, self.lastHeight = self.gameDisplay.get_size()
 
@@ -161,7 +164,8 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
         cells["level"]= level
         self.pocket = self.levelData["pocket"]
         self.complexLayout = []
-        self.finals= []
+        # Positions of the starting level selectors ("L0"), the light sources of the menu
+        self.starts= []
 
         for y, row in enumerate(self.simpleLayout):
             self.complexLayout.append([])
@@ -174,32 +178,19 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
                         data=self.cellData[cell]["data"]
                     )
                 )
-                if cell[0] == "F":
-                    self.finals.append(self.complexLayout[y][-1])
-
-        self.gameDisplay.fill((0, 75, 85))
-
-        self.makeGradient()
-        self.makeBorder()
-
-        # Draw initial cells
-        for y in range(self.levelData["height"]):
-            for x in range(self.levelData["width"]):
-                self.placeBack(x, y)
-                self.placeCell(x, y)
-
-        for y in range(len(self.simpleLayout)):
-            for x in range(len(self.simpleLayout[0])):
-                if self.simpleLayout[y][x] == "L0":
-                    newLights, rtrn = self.complexLayout[y][x].changeLight()
-                    if rtrn is not True:
-                        for Dir, color in newLights.items():
-                            self.beam(x, y, Dir, color)
+                if cell == "L0":
+                    self.starts.append((x, y))
 
+        self.board = board(self.complexLayout)
 
-                        self.beam(x, y, Dir, color)
+        # Build the window layers and draw the initial cells
+        self.layers = compositor(self.layerOrder)
+        self.redraw()
 
-        pygame.display.update()
+        # Light the starting level selectors through the board, like every later recalculation
+        self.calculate()
+        # The first frame runs without waiting for input (it draws the hover highlight)
+        self.frames.request()
 
     def play(self):
         pastCol = None
@@ -207,7 +198,7 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
         out = False
         while not out:
             try:
-                for event in pygame.event.get():
+                for event in self.frames.wait():
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         exit()
@@ -227,10 +218,9 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
                         self.placeBack(pastCol, pastRow)
                         self.placeCell(pastCol, pastRow)
                     pastCol, pastRow = col, row
-                    if self.complexLayout[row][col].name == "L":
+                    if self.complexLayout[row][col].code == kinds.level:
                         if self.complexLayout[row][col].state in [1, 2]:
-                            self.gameDisplay.blit(self.highlight, (col * self.cellSize + self.offsetX, row * self.cellSize + self.offsetY))
-                            self.placeCell(col, row)
+                            self.placeHighlight(col, row)
             elif pastCol is not None and pastRow is not None:
                 self.placeBack(pastCol, pastRow)
                 self.placeCell(pastCol, pastRow)
@@ -245,13 +235,9 @@ class menu(LightHackGame): # Final menu class for playing levels and tutorials
                 self.lastWidth, self.lastHeight = self.gameDisplay.get_size()
                 self.offsetX = (self.lastWidth - self.min_width) // 2 + 33
                 self.offsetY = (self.lastHeight - self.min_height) // 2 + 33
-                self.makeGradient()
-                self.makeBorder()
-                for y in range(self.levelData["height"]):
-                    for x in range(self.levelData["width"]):
-                        self.placeBack(x, y)
-                        self.placeCell(x, y)
-            pygame.display.update()
+                self.redraw()
+            self.present()
+            self.frames.done()
 if __name__ == "__main__":
     game = menu()
     game.load("section1")
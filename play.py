@@ -1,13 +1,16 @@
 # Import necessary modules
 from time import sleep
 from cells.default import default
-from cells.texturing import multiply
+from cells.texturing import tint, tints, cache, sprites
 from cells.indicator import numbers
 import pygame
 import logging
-import numpy as np
 import json
 from cells import cells
+from engine import board, scale, kinds
+from scheduler import scheduler
+from chrome import gradients, frames
+from compositor import compositor
 from screeninfo import get_monitors
 
 monitors = get_monitors()
@@ -16,11 +19,23 @@ screenHeight = main_monitor.height
 
 class LightHackGame:
     """Main game class that handles the Light Hack puzzle game mechanics."""
+
+    # True if completing every final cell wins the level (the level editor turns it off)
+    winnable = True
+
+    # Window layers above the static chrome, bottom to top (see compositor.compositor)
+    layerOrder = ("highlight", "board", "pocket", "info")
     
-    def __init__(self):
-        """Initialize the game with default values for all game state variables."""
+    def __init__(self, fps: int|None = None):
+        """
+        Initialize the game with default values for all game state variables.
+
+        Args:
+            fps: Target frame rate while something animates (see scheduler.fps if None)
+        """
         # Game layout and cell management
         self.complexLayout: list[list[default]] = []  # 2D array of game cells with cell classes
+        self.board: board|None = None  # Headless simulation board sharing complexLayout
         self.gameDisplay = None  # Pygame display surface
         
         # Visual assets
@@ -36,69 +51,106 @@ class LightHackGame:
         self.pocket = None  # Player's inventory of available cells
         self.levelData = None  # Complete level configuration
         self.selectedPocket = 0  # Currently selected pocket slot (0-14)
+        self.pocketCells = {}  # Preview cell instances for the pocket panel, keyed by pocket ID
+        self.qtySprites = {}  # Scaled quantity indicators keyed by (quantity, cell size)
+
+        # Display updates
+        self.layers = compositor(self.layerOrder)  # Off-screen window layers, recomposited where they changed
+        self.frames = scheduler(fps)  # Frame pacing of the loops: sleeps while idle, keeps frame-time stats
 
         self.cellSize = int(screenHeight / 13.5)  # Size of each cell in pixels
 
-    def makeGradient(self):
-        """Creates and returns a gradient surface filling the screen."""
-        # Gradient should cover entire screen
-        surf = pygame.Surface((self.lastWidth, self.lastHeight))
-        arr = np.zeros((self.lastWidth, self.lastHeight, 3), dtype=np.uint8)  # <-- swapped order
-
-        # Determine center
-        center_x = self.lastWidth // 2
-        center_y = self.lastHeight // 2
-        max_dist = np.sqrt(center_x**2 + center_y**2)
-
-        # Build coordinate grids matching the array shape
-        x = np.arange(self.lastWidth)
-        y = np.arange(self.lastHeight)
-        X, Y = np.meshgrid(x, y, indexing="xy")
-
-        dx = X - center_x
-        dy = Y - center_y
-        dist = np.sqrt(dx**2 + dy**2) / max_dist
-        dist = np.clip(1 - dist, 0, 1)
-
-        # Adjust falloff so center is near full color
-        inner_radius = min(self.min_width, self.min_height) / 1.5
-        falloff_radius = max(center_x, center_y)
-        falloff = np.clip(1 - (dist * (falloff_radius / inner_radius)) * 0.5, 0, 1)
-
-        # Transpose falloff to match (width, height)
-        falloff = falloff.T
-
-        # Apply the color gradient
-        for i in range(3):
-            arr[..., i] = (np.array([0, 175, 185])[i] * falloff).astype(np.uint8)
-
-        pygame.surfarray.blit_array(surf, arr)
-        self.gameDisplay.blit(surf, (0, 0))
+    def makeGradient(self, target=None):
+        """Draw the gradient filling the screen on target (the window by default; built once per window size, see chrome.gradients)."""
+        target = self.gameDisplay if target is None else target
+        target.blit(gradients.get((self.lastWidth, self.lastHeight), min(self.min_width, self.min_height)), (0, 0))
     
-    def makeBorder(self):
-        """Draw the border around the game area."""
-        # Draw sides
-        for x in range(self.min_width // 16 - 3):
-            self.gameDisplay.blit(self.borderS, (self.offsetX + x * 16, self.offsetY - 33))  # Top side
-            self.gameDisplay.blit(pygame.transform.rotate(self.borderS, 180), (self.offsetX + x * 16, self.offsetY + self.min_height - 66))  # Bottom side
-        for y in range(self.min_height // 16 - 3):
-            self.gameDisplay.blit(pygame.transform.rotate(self.borderS, 90), (self.offsetX - 33, self.offsetY + y * 16))  # Left side
-            self.gameDisplay.blit(pygame.transform.rotate(self.borderS, 270), (self.offsetX + self.min_width - 66, self.offsetY + y * 16))  # Right side
-
-        # Draw corners
-        self.gameDisplay.blit(self.borderC, (self.offsetX - 33, self.offsetY - 33))  # Top-left
-        self.gameDisplay.blit(pygame.transform.rotate(self.borderC, 270), (self.offsetX + self.min_width - 66, self.offsetY - 33))  # Top-right
-        self.gameDisplay.blit(pygame.transform.rotate(self.borderC, 90), (self.offsetX - 33, self.offsetY + self.min_height - 66))  # Bottom-left
-        self.gameDisplay.blit(pygame.transform.rotate(self.borderC, 180), (self.offsetX + self.min_width - 66, self.offsetY + self.min_height - 66))  # Bottom-right
+    def makeBorder(self, target=None):
+        """Draw the border around the game area on target (the window by default; edge strips built once per play area size, see chrome.frames)."""
+        target = self.gameDisplay if target is None else target
+        for piece, (x, y) in frames.get(self.borderS, self.borderC, (self.min_width, self.min_height)):
+            target.blit(piece, (self.offsetX + x, self.offsetY + y))
+
+    def paintChrome(self, target): #Paint everything static
+        """
+        Paint the static part of the window on target: gradient, border, cell backgrounds,
+        separator and tutorial texts. It only changes with the window size or level.
+        """
+        target.fill((0, 75, 85))
+        self.makeGradient(target)
+        self.makeBorder(target)
+        # Cell backgrounds of the whole grid
+        for y in range(self.levelData["height"]):
+            for x in range(self.levelData["width"]):
+                target.blit(self.background, (x * self.cellSize + self.offsetX, y * self.cellSize + self.offsetY))
+        # Separator between game area and inventory
+        pygame.draw.rect(
+                    target, (0, 75, 85),
+                    (self.levelData["width"] * self.cellSize + self.offsetX, self.offsetY, 5, self.levelData["height"] * self.cellSize)
+                )
+        # Instructional texts if provided
+        if self.texts is not None:
+            font= pygame.font.Font(None, int(screenHeight / 45))
+            for i, txt in enumerate(self.texts):
+                rendered_txt = font.render(txt, True, (5,25,55))
+                target.blit(rendered_txt, (self.offsetX + 10, self.offsetY + self.min_height - 188 + i * 20))
+
+    def redraw(self): #Rebuild every layer
+        """
+        Rebuild the whole window after a load or resize: repaint the chrome off-screen
+        and place every cell and the inventory again at the current offsets.
+        """
+        chrome = pygame.Surface(self.gameDisplay.get_size()).convert()
+        self.paintChrome(chrome)
+        self.layers.setChrome(chrome)
+        # Positions moved, transient layers are dropped and the rest placed again
+        self.layers.clear("highlight")
+        self.layers.clear("info")
+        for y in range(self.levelData["height"]):
+            for x in range(self.levelData["width"]):
+                self.placeCell(x, y)
+        self.drawPocketCells()
+
+    def present(self): #Push the frame to the screen
+        """
+        Recomposite what changed since the last call (see compositor.compose()) and update
+        the screen once: the whole window after a load, resize or pause, otherwise only
+        the rectangles that were rebuilt.
+        """
+        rects = self.layers.compose(self.gameDisplay)
+        if rects is None:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+
+    def cellPosition(self, x: int, y: int):
+        """Window position of the top-left corner of grid cell (x, y)."""
+        return (x * self.cellSize + self.offsetX, y * self.cellSize + self.offsetY)
 
     def placeBack(self, x: int, y: int): #Place the background of the cell
-        """Draw the background texture for a cell at position (x, y)."""
-        self.gameDisplay.blit(self.background, (x * self.cellSize + self.offsetX, y * self.cellSize + self.offsetY))
+        """Bring the cell at position (x, y) back to its background: drop its hover highlight and overlay."""
+        self.layers.remove("highlight", (x, y))
+        self.layers.remove("info", (x, y))
+        self.layers.invalidate(self.background.get_rect(topleft=self.cellPosition(x, y)))
+
+    def placeHighlight(self, x: int, y: int): #Highlight the cell
+        """Show the hover highlight under the cell at position (x, y)."""
+        self.layers.put("highlight", (x, y), self.highlight, self.cellPosition(x, y))
+
+    def placeSprite(self, x: int, y: int, sprite, overlay=False):
+        """Show a rendered cell at position (x, y), on the board layer or, for overlays, above it."""
+        self.layers.put("info" if overlay else "board", (x, y), sprite, self.cellPosition(x, y))
 
     def placeCell(self, x: int, y: int, overlay=False): #Place the cell
         """Draw a game cell at position (x, y) with optional overlay effect."""
         if self.complexLayout[y][x] is not None:
-            self.gameDisplay.blit(self.complexLayout[y][x].render(scale=(self.cellSize,self.cellSize),overlay=overlay), (x*self.cellSize + self.offsetX, y*self.cellSize + self.offsetY))
+            self.placeSprite(x, y, self.complexLayout[y][x].render(size=(self.cellSize,self.cellSize),overlay=overlay), overlay)
+
+    def placeCells(self, positions): #Redraw a set of cells
+        """Redraw the background and cell at every (x, y) position given (e.g. the cells a simulation changed)."""
+        for x, y in positions:
+            self.placeBack(x, y)
+            self.placeCell(x, y)
 
     def drawPocketCells(self): #Draw the cells in the pocket
         """Render the inventory panel showing available cells and their quantities."""
@@ -106,93 +158,145 @@ class LightHackGame:
         for i in range(15):
             x = i % 3
             y = i // 3
-            self.gameDisplay.blit(self.backgroundPocket, (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY))
-            # Highlight currently selected pocket slot
-            if i == self.selectedPocket:
-                self.gameDisplay.blit(self.highlightPocket, (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 +self.offsetX, y*self.cellSize*2 + self.offsetY))
+            self.layers.put("pocket", ("back", i), self.backgroundPocket, (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY))
+        # Highlight currently selected pocket slot (slots do not overlap, so it is drawn right after the backgrounds)
+        x = self.selectedPocket % 3
+        y = self.selectedPocket // 3
+        self.layers.put("pocket", "selected", self.highlightPocket, (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 +self.offsetX, y*self.cellSize*2 + self.offsetY))
         # Draw the actual cell items and their quantities
         for i, (cell, qty) in enumerate(self.pocket.items()):
             x = i % 3
             y = i // 3
-            # Render the cell image in the pocket slot
-            self.gameDisplay.blit(
-                cells[self.cellData[cell]["type"]](data=self.cellData[cell]["data"]).render(scale=(self.cellSize*2,self.cellSize*2)),
+            # Render the cell image in the pocket slot (preview cells are rebuilt only when their data entry changes)
+            if cell not in self.pocketCells or self.pocketCells[cell][0] is not self.cellData[cell]:
+                self.pocketCells[cell] = (self.cellData[cell], cells[self.cellData[cell]["type"]](data=self.cellData[cell]["data"]))
+            self.layers.put("pocket", ("cell", i),
+                self.pocketCells[cell][1].render(size=(self.cellSize*2,self.cellSize*2)),
                 (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY)
             )
+            # Display quantity indicator (already scaled sprite, built on first use)
+            self.layers.put("pocket", ("qty", i), self.qtySprite(qty), (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY))
+        # Slots emptied since the last call (e.g. an entry deleted in the editor)
+        for i in range(len(self.pocket), 15):
+            self.layers.remove("pocket", ("cell", i))
+            self.layers.remove("pocket", ("qty", i))
+
+    def qtySprite(self, qty):
+        """Return the scaled quantity indicator for a pocket slot, building it on first use."""
+        key = (qty, self.cellSize)
+        if key not in self.qtySprites:
+            indicator = self.qty.copy()
             # Display quantity indicator for available items
             if qty > 0:
                 qty= "0" + str(qty)  # Format quantity as 2-digit string
-                indicator = self.qty.copy()
                 # Draw cyan-colored quantity numbers
-                indicator.blit(multiply(self.numbers[int(qty[-2])], (0,255,255)), (13, 33))
-                indicator.blit(multiply(self.numbers[int(qty[-1])], (0,255,255)), (23, 33))
-                self.gameDisplay.blit(pygame.transform.scale(indicator, (self.cellSize*2, self.cellSize*2)), (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY))
+                indicator.blit(tint(self.numbers[int(qty[-2])], (0,255,255)), (13, 33))
+                indicator.blit(tint(self.numbers[int(qty[-1])], (0,255,255)), (23, 33))
             else:
                 # Display "00" in orange when item is out of stock
-                qty= "00"
-                indicator = self.qty.copy()
-                indicator.blit(multiply(self.numbers[0], (255,155,0)), (13, 33))
-                indicator.blit(multiply(self.numbers[0], (255,155,0)), (23, 33))
-                self.gameDisplay.blit(pygame.transform.scale(indicator, (self.cellSize*2, self.cellSize*2)), (self.levelData["width"] * self.cellSize + 5 + x*self.cellSize*2 + self.offsetX, y*self.cellSize*2 + self.offsetY))
+                indicator.blit(tint(self.numbers[0], (255,155,0)), (13, 33))
+                indicator.blit(tint(self.numbers[0], (255,155,0)), (23, 33))
+            self.qtySprites[key] = pygame.transform.scale(indicator, (self.cellSize*2, self.cellSize*2))
+        return self.qtySprites[key]
+
+    def rebuildSprites(self):
+        """Rebuild the scaled sprites of every cell for the current cell size in one batch."""
+        size = (self.cellSize, self.cellSize)
+        # Drop sprites scaled for other cell sizes, then scale the board and pocket
+        sprites.retain(size, (self.cellSize*2, self.cellSize*2))
+        for row in self.complexLayout:
+            for cell in row:
+                # Overlay sprites are only needed on demand (E key), so just the plain view is prepared
+                cell.texture.rebuild(size)
+        for entry, cell in self.pocketCells.values():
+            cell.texture.rebuild((self.cellSize*2, self.cellSize*2))
+        self.qtySprites = {key: sprite for key, sprite in self.qtySprites.items() if key[1] == self.cellSize}
+
+    def producibleColors(self, limit=128):
+        """
+        Collect the light colors (game scale 0-10) the current level can produce.
+        Starts from every laser color and closes the set under the operations of the
+        cells available in the level: beam addition, glass, filters and prism splitting.
+        Stops growing once 'limit' colors have been found.
+        """
+        # Gather the seed colors and the operations offered by the level's cells
+        found = set()
+        glasses = set()
+        filters = set()
+        prisms = False
+        for cell in self.cellData.values():
+            data = cell["data"]
+            match cell["type"]:
+                case "laser":
+                    found.add(tuple(data["color"]))
+                case "glass":
+                    glasses.add((data["type"], data["potency"]))
+                case "final":
+                    filters.add(tuple(data.get("color", (0,0,0))))
+                case "prism":
+                    prisms = True
+        found.discard((0,0,0))
+
+        # Expand the set until nothing new appears (or the limit is reached)
+        pending = list(found)
+        while pending and len(found) < limit:
+            color = pending.pop()
+            derived = []
+            # Glass amplifies (type 0) or attenuates (type 1) every lit channel
+            for kind, potency in glasses:
+                sign = -1 if kind == 1 else 1
+                derived.append(tuple(max(0, min(10, c + sign * potency * int(bool(c)))) for c in color))
+            # Filters subtract their color from the passing light
+            for f in filters:
+                derived.append(tuple(max(0, color[i] - f[i]) for i in range(3)))
+            # Prisms isolate single channels
+            if prisms:
+                derived.extend(tuple(color[i] if i == j else 0 for i in range(3)) for j in range(3))
+            # Beams meeting in a cell add up
+            for other in list(found):
+                derived.append(tuple(min(10, color[i] + other[i]) for i in range(3)))
+            for new in derived:
+                if new != (0,0,0) and new not in found and len(found) < limit:
+                    found.add(new)
+                    pending.append(new)
+        return found
+
+    def warmTints(self):
+        """Pre-tint the beam textures with every color the level can produce."""
+        # The rotated variants default.beamRenderer tints (the tint cache is keyed by texture identity)
+        textures = default.beamVariants()
+        # Leave half of the tint cache for indicator digits and overlays
+        limit = tints.capacity // (2 * len(textures))
+        # Beam renderers tint in display scale (0-255), same conversion as default.beamRenderer
+        colors = [scale.display(color) for color in self.producibleColors(limit)]
+        tints.warm(textures, colors)
 
     def beam(self, startX, startY, Dir, color): #Shoot a beam from (startX, startY) in direction Dir with color
         """
-        Cast a light beam from starting position in specified direction.
-        The beam continues until it hits a non-empty cell or goes out of bounds.
+        Cast a light beam from starting position in specified direction (see engine.board.beam)
+        and redraw the cells whose look changed.
         """
-        # Calculate direction vectors: Up=0, Right=1, Down=2, Left=3
-        dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
-        x, y = startX + dx, startY + dy
-        
-        # Continue beam through empty cells ('D' type)
-        while self.complexLayout[y][x] == 'D':
-            # Apply light effect to current cell
-            self.complexLayout[y][x].changeLight(From=[2, 3, 0, 1][Dir], color=color)
-            # Redraw the cell with updated lighting
-            self.placeBack(x, y)
-            self.placeCell(x, y)
-            # Move to next position
-            x, y = x + dx, y + dy
-            # Check if beam goes out of bounds
-            if x < 0 or y < 0 or x >= self.levelData["width"] or y >= self.levelData["height"]:
-                x, y = x - dx, y - dy
-                return
-
-        # Handle interaction with non-empty cell
-        newLights, rtrn = self.complexLayout[y][x].changeLight(From=[2, 3, 0, 1][Dir], color=color)
-        self.placeBack(x, y)
-        self.placeCell(x, y)
-        # If cell doesn't absorb the light, continue with new beams
-        if not rtrn:
-            for Dir, color in newLights.items():
-                self.beam(x, y, Dir, color)
-
-    def calculate(self):
+        visited = self.board.beam(startX, startY, Dir, color)
+        self.placeCells(self.board.changes(visited))
+
+    def calculate(self, *changed):
         """
-        Recalculate all light beams in the game grid.
-        First resets all cells, then processes laser sources to cast new beams.
+        Recalculate all light beams in the game grid with the headless engine
+        and redraw only the cells whose look changed.
+        Given the grid positions of changed cells, only the light affected by them
+        is retraced (see engine.board.update).
+        Returns the engine result (see engine.board.result).
         """
-        # Reset all cells to their initial state (clear lighting effects)
-        for y in range(len(self.complexLayout)):
-            for x in range(len(self.complexLayout[0])):
-                self.complexLayout[y][x].restart()
-
-        # Process all laser sources and cast beams
-        for y in range(len(self.complexLayout)):
-            for x in range(len(self.complexLayout[0])):
-                # Check if current cell is a laser source
-                if self.complexLayout[y][x] == "L":
-                    newLights, rtrn = self.complexLayout[y][x].changeLight()
-                    # Cast beams from laser if it emits light
-                    if rtrn is not True:
-                        for Dir, color in newLights.items():
-                            self.beam(x, y, Dir, color)
-                # Redraw each cell after processing
-                self.placeBack(x, y)
-                self.placeCell(x, y)
+        if changed:
+            # Retrace only the lasers whose light the change affects
+            result = self.board.update(*changed)
+        else:
+            # Reset all cells and fire every laser
+            result = self.board.simulate()
 
-        # Update the display to show all changes
-        pygame.display.update()
+        # Redraw the changed cells (the play loop presents them with the rest of the frame)
+        self.placeCells(result.changed)
+        return result
 
     def keyHandler(self, event):
         """Handle all user input events (mouse clicks and keyboard presses)."""
@@ -208,11 +312,11 @@ class LightHackGame:
                 if x >= 0 and y >= 0 and x < self.levelData["width"] and y < self.levelData["height"] and self.selectedPocket < len(self.pocket):
                     cellKey = list(self.pocket.keys())[self.selectedPocket]
                     # Place cell if available in inventory and target is empty
-                    if self.pocket[cellKey] > 0 and self.complexLayout[y][x].name == "D":
+                    if self.pocket[cellKey] > 0 and self.complexLayout[y][x].code == kinds.empty:
                         self.complexLayout[y][x] = self.complexLayout[y][x].convert(cells[self.cellData[cellKey]["type"]], name=cellKey, data=self.cellData[cellKey]["data"])
                         self.pocket[cellKey] -= 1
                         self.drawPocketCells()
-                        self.calculate()
+                        self.calculate((x, y))
                 # Click on inventory panel to select different pocket slot
                 else:
                     x, y= (mouseX - (self.levelData["width"] * self.cellSize + 5 + self.offsetX)) // (self.cellSize*2), (mouseY - self.offsetY) // (self.cellSize*2)
@@ -226,7 +330,7 @@ class LightHackGame:
                     if self.complexLayout[y][x].name in self.pocket:
                         self.pocket[self.complexLayout[y][x].name] += 1
                         self.complexLayout[y][x] = self.complexLayout[y][x].convert(other=cells["default"], name="D")
-                        self.calculate()
+                        self.calculate((x, y))
                         self.drawPocketCells()
 
         # Handle keyboard input
@@ -277,18 +381,20 @@ class LightHackGame:
                     now = self.complexLayout[y][x].direction
                     newDir = 0 if now == 3 else now + 1
                     self.complexLayout[y][x].changeDirection(newDir)
-                    self.calculate()
+                    self.calculate((x, y))
 
             # F key - flip cell under mouse cursor
             elif event.key == pygame.K_f:
                 if x >= 0 and y >= 0 and x < self.levelData["width"] and y < self.levelData["height"] and self.levelData["layout"][y][x] == "D":
                     if self.complexLayout[y][x].flip():
-                        self.calculate()
+                        self.calculate((x, y))
 
             # E key - show overlay for cell under mouse cursor
             elif event.key == pygame.K_e:
                 if x >= 0 and y >= 0 and x < self.levelData["width"] and y < self.levelData["height"]:
                     self.placeCell(x, y, overlay=True)
+                    # The overlay stays on screen until the cell is redrawn
+                    self.board.invalidate((x, y))
 
             # ESC key - abrir menú de pausa con controles y botones
             elif event.key == pygame.K_ESCAPE:
@@ -324,7 +430,7 @@ class LightHackGame:
                     self.gameDisplay.blit(txt_continue, (btn_continue.x + 10, btn_continue.y + 10))
                     self.gameDisplay.blit(txt_exit, (btn_exit.x + 35, btn_exit.y + 10))
                     pygame.display.update()
-                    for pause_event in pygame.event.get(): # Manejo de eventos en pausa
+                    for pause_event in self.frames.wait(): # Manejo de eventos en pausa
                         if pause_event.type == pygame.QUIT:
                             return "exit"
                         elif pause_event.type == pygame.KEYDOWN:
@@ -336,47 +442,20 @@ class LightHackGame:
                                 paused = False
                             elif btn_exit.collidepoint(mx, my):
                                 return "exit"
-                    # Redraw gradient background
-                self.makeGradient()
-
-                # Redraw border around game area
-                self.makeBorder()
-
-                # Redraw entire game grid after resize
-                for y in range(self.levelData["height"]):
-                    for x in range(self.levelData["width"]):
-                        self.placeBack(x, y)
-                        self.placeCell(x, y)
-
-                # Redraw separator between game area and inventory
-                pygame.draw.rect(
-                    self.gameDisplay, (0, 75, 85),
-                    (self.levelData["width"] * self.cellSize + self.offsetX, self.offsetY, 15, self.levelData["height"] * self.cellSize)
-                )
-
-                # Redraw inventory panel
-                self.drawPocketCells()
-
-                # Redraw texts if they exist
-                if self.texts is not None:
-                    font= pygame.font.Font(None,int(screenHeight / 45))
-                    for i, txt in enumerate(self.texts):
-                        rendered_txt = font.render(txt, True, (5,25,55))
-                        self.gameDisplay.blit(rendered_txt, (self.offsetX + 10, self.offsetY + self.min_height - 188 + i * 20))
+                # The pause menu covered the whole window, recomposite it from the cached layers
+                self.layers.invalidate()
 
                 return "continue"
 
         # Check if level is completed - all final cells must be completed
-        for f in self.finals:
-            if not f.isCompleated:
-                break
-        else:
+        # (the board keeps the win check up to date as light changes, see engine.board.completed)
+        if self.winnable and self.board.completed():
             # Display level completion message
             font = pygame.font.SysFont('Arial', 64)
             text = font.render('Level Completed!', True, (255, 255, 255))
             text_rect = text.get_rect(center=(self.min_width // 2, self.min_height // 2))
-            self.gameDisplay.blit(text, text_rect)
-            pygame.display.update()
+            self.layers.put("info", "win", text, text_rect.topleft)
+            self.present()
             sleep(2)
             return "win"
 
@@ -416,14 +495,14 @@ class LightHackGame:
         pygame.display.set_caption(f"Light Hack")
         
         # Load and scale background textures
-        self.borderC = pygame.image.load("assets/border/corner.png").convert_alpha()
-        self.borderS = pygame.image.load("assets/border/side.png").convert_alpha()
-        self.background = pygame.image.load("assets/background.png")
+        self.borderC = cache.get("border/corner.png")
+        self.borderS = cache.get("border/side.png")
+        self.background = cache.get("background.png")
         self.backgroundPocket = pygame.transform.scale(self.background, (self.cellSize*2, self.cellSize*2))
         self.background = pygame.transform.scale(self.background, (self.cellSize, self.cellSize))
-        self.qty = pygame.image.load("assets/indicators/qty.png").convert_alpha()
-        self.numbers= tuple(pygame.image.load(f"assets/{i}").convert_alpha() for i in numbers)
-        highlight = pygame.image.load("assets/highlight.png").convert_alpha()
+        self.qty = cache.get("indicators/qty.png")
+        self.numbers= tuple(cache.get(i) for i in numbers)
+        highlight = cache.get("highlight.png")
         self.highlight = pygame.transform.scale(highlight, (self.cellSize, self.cellSize))
         self.highlightPocket = pygame.transform.scale(highlight, (self.cellSize*2, self.cellSize*2))
         self.lastWidth, self.lastHeight = self.gameDisplay.get_size()
@@ -433,7 +512,12 @@ class LightHackGame:
         self.cellData = self.levelData["cells"]
         self.pocket = self.levelData["pocket"]
         self.complexLayout = []
-        self.finals= []
+
+        # Count distinct cell signatures per level (see sprites.distinct())
+        sprites.resetStats()
+
+        # Pre-tint beam textures so the first light calculation hits the tint cache
+        self.warmTints()
 
         # Create complex layout by converting simple layout to cell objects
         for y, row in enumerate(self.simpleLayout):
@@ -447,47 +531,24 @@ class LightHackGame:
                         data=self.cellData[cell]["data"]
                     )
                 )
-                # Track final cells for level completion checking
-                if cell[0] == "F":
-                    self.finals.append(self.complexLayout[y][-1])
-
-        # Set background color and draw initial game state
-        self.gameDisplay.fill((0, 75, 85))
 
-        self.makeGradient()
-        self.makeBorder()
+        # Simulation board working on the same cells (it registers the lasers and final cells)
+        self.board = board(self.complexLayout)
 
-        # Draw initial cells
-        for y in range(self.levelData["height"]):
-            for x in range(self.levelData["width"]):
-                self.placeBack(x, y)
-                self.placeCell(x, y)
+        # Scale every cell sprite for the current cell size up front
+        self.pocketCells = {}
+        self.rebuildSprites()
+        logging.debug(f"Sprite cache after load: {sprites.distinct()} distinct cell signatures")
 
-        # Add a separator after everything
-        pygame.draw.rect(
-                    self.gameDisplay, (0, 75, 85),
-                    (self.levelData["width"] * self.cellSize + self.offsetX, self.offsetY, 5, self.levelData["height"] * self.cellSize)
-                )
+        # Build the window layers and draw the initial game state
+        self.layers = compositor(self.layerOrder)
+        self.redraw()
 
         # Initialize laser beams for the starting state
-        for y in range(len(self.simpleLayout)):
-            for x in range(len(self.simpleLayout[0])):
-                if self.simpleLayout[y][x][0] == "L":
-                    newLights, rtrn = self.complexLayout[y][x].changeLight()
-                    if rtrn is not True:
-                        for Dir, color in newLights.items():
-                            self.beam(x, y, Dir, color)
-
-        # Draw inventory panel and update display
-        self.drawPocketCells()
-
-        # Render instructional texts if provided
-        if self.texts is not None:
-            font= pygame.font.Font(None, int(screenHeight / 45))
-            for i, txt in enumerate(self.texts):
-                rendered_txt = font.render(txt, True, (5,25,55))
-                self.gameDisplay.blit(rendered_txt, (self.offsetX + 10, self.offsetY + self.min_height - 188 + i * 20))
-        pygame.display.update()
+        self.placeCells(self.board.simulate().changed)
+        self.present()
+        # The first frame runs without waiting for input (it draws the hover highlight)
+        self.frames.request()
 
     def play(self):
         """Main game loop that handles events, input, and display updates."""
@@ -496,11 +557,11 @@ class LightHackGame:
         pastRow = None
         out = "continue"
         
-        # Main game loop
+        # Main game loop: one frame per batch of events (the scheduler sleeps until there is one)
         while out == "continue":
-            # Handle all pygame events
+            # Handle all pygame events, the simulation runs as they change the board
             try:
-                for event in pygame.event.get():
+                for event in self.frames.wait():
                     # Handle window close button
                     if event.type == pygame.QUIT:
                         pygame.quit()
@@ -528,9 +589,8 @@ class LightHackGame:
                         self.placeCell(pastCol, pastRow)
                     pastCol, pastRow = col, row
 
-                    # Add highlight to current cell and redraw it
-                    self.gameDisplay.blit(self.highlight, (col * self.cellSize + self.offsetX, row * self.cellSize + self.offsetY))
-                    self.placeCell(col, row)
+                    # Add highlight under the current cell
+                    self.placeHighlight(col, row)
 
             # Remove highlight when mouse leaves game area
             elif pastCol is not None and pastRow is not None:
@@ -551,36 +611,14 @@ class LightHackGame:
                 self.offsetX = (self.lastWidth - self.min_width) // 2 + 33
                 self.offsetY = (self.lastHeight - self.min_height) // 2 + 33
 
-                # Redraw gradient background
-                self.makeGradient()
-
-                # Redraw border around game area
-                self.makeBorder()
-
-                # Redraw entire game grid after resize
-                for y in range(self.levelData["height"]):
-                    for x in range(self.levelData["width"]):
-                        self.placeBack(x, y)
-                        self.placeCell(x, y)
-
-                # Redraw separator between game area and inventory
-                pygame.draw.rect(
-                    self.gameDisplay, (0, 75, 85),
-                    (self.levelData["width"] * self.cellSize + self.offsetX, self.offsetY, 15, self.levelData["height"] * self.cellSize)
-                )
+                # Repaint the chrome and place everything at the new offsets
+                self.redraw()
 
-                # Redraw inventory panel
-                self.drawPocketCells()
-
-                # Redraw texts if they exist
-                if self.texts is not None:
-                    font= pygame.font.Font(None,int(screenHeight / 45))
-                    for i, txt in enumerate(self.texts):
-                        rendered_txt = font.render(txt, True, (5,25,55))
-                        self.gameDisplay.blit(rendered_txt, (self.offsetX + 10, self.offsetY + self.min_height - 188 + i * 20))
-
-            pygame.display.update()
+            # One screen update per frame, limited to what was drawn
+            self.present()
+            self.frames.done()
         
+        logging.debug(f"Frame times: {self.frames.report()}")
         pygame.display.quit()
         pygame.quit()
         return out
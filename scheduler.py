@@ -0,0 +1,100 @@
+# Frame pacing for the game loops: wait for input instead of polling, cap the frame rate
+# while something animates and keep frame-time statistics
+from collections import deque  # Import deque to keep the most recent frame times
+from time import perf_counter  # Import a monotonic clock for the frame times
+from math import ceil  # Import ceil to round waits up to whole milliseconds
+import pygame
+
+class scheduler():
+    """
+    Paces a pygame loop. Each frame starts with wait(), which hands over the events of the frame,
+    and ends with done() once the frame was simulated and presented.
+    While idle (nothing animating) wait() blocks until an event arrives, so an idle window
+    uses no CPU; while animating it returns at the target frame rate. Input always wakes it
+    at once, so pacing never delays the response to an event.
+    """
+
+    # Default target frames per second while animating
+    fps= 60
+
+    # Number of recent frames the statistics cover
+    window= 600
+
+    def __init__(self, fps:int|None=None):
+        """
+        Args:
+            fps: Target frames per second while animating (class default if None)
+        """
+        if fps is not None:
+            self.fps = fps
+        # True while something on screen moves on its own and needs frames without input
+        self.animating = False
+        # True if the next frame should run without waiting for input (see request())
+        self.requested = False
+        # When the next animation frame is due (perf_counter seconds) and when the current one started
+        self.due = 0.0
+        self.started = 0.0
+        # Work time of the recent frames (seconds from wake-up to presented) and the total count
+        self.times = deque(maxlen=self.window)
+        self.frames = 0
+
+    def wait(self) -> list:
+        """
+        Wait for the next frame and return its events.
+
+        Returns:
+            List of pygame events (empty for an animation frame with no input)
+        """
+        if self.requested:
+            # A frame was asked for, run it right away with whatever input is queued
+            event = pygame.event.poll()
+            self.requested = False
+        elif self.animating:
+            # Sleep until the frame is due, but wake at once for input
+            event = pygame.event.poll()
+            while event.type == pygame.NOEVENT and perf_counter() < self.due:
+                event = pygame.event.wait(max(1, ceil((self.due - perf_counter()) * 1000)))
+            # Input arriving early does not move the next animation frame
+            if perf_counter() >= self.due:
+                self.due = max(self.due + 1 / self.fps, perf_counter())
+        else:
+            # Nothing moves: sleep until something happens
+            event = pygame.event.wait()
+            self.due = perf_counter() + 1 / self.fps
+        self.started = perf_counter()
+        # Take everything queued since, so one frame handles a burst of input
+        events = [] if event.type == pygame.NOEVENT else [event]
+        return events + pygame.event.get()
+
+    def request(self):
+        """Ask for one frame without waiting for input (e.g. to draw the hover highlight after loading)."""
+        self.requested = True
+
+    def done(self):
+        """Mark the end of the frame started by the last wait() (after presenting it)."""
+        self.times.append(perf_counter() - self.started)
+        self.frames += 1
+
+    def stats(self) -> dict:
+        """
+        Frame-time statistics of the recent frames.
+
+        Returns:
+            Dictionary with the frame count, the target frame rate while animating ('fps'), and the
+            mean, 95th percentile and worst frame time in milliseconds over the last 'window' frames
+        """
+        times = sorted(self.times)
+        if not times:
+            return {"frames": self.frames, "fps": self.fps, "mean": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "frames": self.frames,
+            "fps": self.fps,
+            "mean": sum(times) / len(times) * 1000,
+            "p95": times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+            "max": times[-1] * 1000,
+        }
+
+    def report(self) -> str:
+        """One line summary of stats() for the logs."""
+        stats = self.stats()
+        return f"{stats['frames']} frames, {stats['mean']:.2f} ms mean, {stats['p95']:.2f} ms p95, {stats['max']:.2f} ms max (target {stats['fps']} fps)"
@@ -0,0 +1,83 @@
+# Shared fixtures: the bundled levels and the edits a player makes on them, applied to headless boards
+import copy
+import json
+import random
+from pathlib import Path
+import pytest
+from engine import board, models, kinds
+
+# Bundled levels of the first section
+levelPaths = sorted((Path(__file__).resolve().parent.parent / "levels" / "section1").glob("*.json"))
+
+def pytest_generate_tests(metafunc):
+    # Tests asking for 'levelPath' run once per bundled level
+    if "levelPath" in metafunc.fixturenames:
+        metafunc.parametrize("levelPath", levelPaths, ids=[path.stem for path in levelPaths])
+
+@pytest.fixture
+def levelData(levelPath) -> dict:
+    """Contents of the level file."""
+    return json.loads(levelPath.read_text())
+
+@pytest.fixture
+def makeBoard(levelData):
+    """Build a new board of pure models from its own copy of the level (cells edit their data in place)."""
+    def make(**kwargs):
+        return board.fromLevel(copy.deepcopy(levelData), **kwargs), copy.deepcopy(levelData)
+    return make
+
+@pytest.fixture
+def edits(levelData) -> list[tuple]:
+    """
+    A fixed sequence of player edits on the level: every optical cell rotated, every prism and
+    final flipped, then pocket cells placed on empty cells, rotated and removed again.
+    """
+    rnd = random.Random(levelData["width"] * 100 + levelData["height"])
+    layout, data = levelData["layout"], levelData["cells"]
+    placed, empty = [], []
+    for y, row in enumerate(layout):
+        for x, name in enumerate(row):
+            kind = data[name]["type"]
+            if kind not in ("default", "block"):
+                placed.append(("rotate", (x, y)))
+                if kind in ("prism", "final"):
+                    placed.append(("flip", (x, y)))
+            elif kind == "default":
+                empty.append((x, y))
+    for position in rnd.sample(empty, min(6, len(empty))):
+        if levelData["pocket"]:
+            placed.append(("place", position, rnd.choice(sorted(levelData["pocket"]))))
+            placed.append(("rotate", position))
+    for edit in list(placed):
+        if edit[0] == "place":
+            placed.append(("remove", edit[1]))
+    return placed
+
+def applyEdit(game, levelData:dict, edit:tuple) -> tuple[int, int]:
+    """Apply one edit from the 'edits' fixture to a board, returning the changed position."""
+    action, (x, y) = edit[0], edit[1]
+    cell = game.layout[y][x]
+    if action == "rotate":
+        cell.changeDirection((cell.direction + 1) % 4)
+    elif action == "flip":
+        cell.flip()
+    elif action == "place":
+        entry = levelData["cells"][edit[2]]
+        game.layout[y][x] = cell.convert(other=models[entry["type"]], name=edit[2], data=copy.deepcopy(entry["data"]))
+    elif action == "remove" and cell.code != kinds.empty:
+        game.layout[y][x] = cell.convert(other=models["default"], name="D")
+    return (x, y)
+
+@pytest.fixture
+def edit():
+    """The function applying an edit to a board (see applyEdit())."""
+    return applyEdit
+
+def snapshot(game) -> dict:
+    """Visual state of every position of a board."""
+    return {(x, y): game.layout[y][x].visualState() for x, y in game.positions()}
+
+@pytest.fixture
+def look():
+    """The function taking a snapshot of a board's look (see snapshot())."""
+    return snapshot
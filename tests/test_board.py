@@ -0,0 +1,141 @@
+# Regression checks of the headless light simulation (engine.board)
+import copy
+import logging
+from engine import board, models, kinds
+
+def darkRow():
+    """Laser sending a dark beam (0,0,0) to the right, an empty cell, then a filter with a (0,0,0) target."""
+    return [
+        models["laser"](data={"direction": 3, "color": (0,0,0)}),
+        models["default"](),
+        models["final"](data={"direction": 0, "final": False, "color": (0,0,0)}),
+        models["block"](),
+    ]
+
+def test_dark_target_cleared_by_full_run():
+    # A dark beam completes the filter without lighting it, a full run after removing the laser must clear it
+    game = board([darkRow()])
+    assert game.simulate().completed
+    game.layout[0][0] = game.layout[0][0].convert(other=models["default"], name="D")
+    assert not game.simulate().completed
+    assert not game.layout[0][2].isCompleated
+
+def test_dark_target_incremental_matches_full(caplog):
+    # A mirror turns the dark beam away: the incremental update and the verify cross-check must agree
+    game = board([[models["block"]()] * 4, darkRow(), [models["block"]()] * 4])
+    game.verify = True
+    assert game.simulate().completed
+    game.layout[1][1] = game.layout[1][1].convert(other=models["mirror"], name="M")
+    with caplog.at_level(logging.ERROR):
+        assert not game.update((1, 1)).completed
+    assert "differs from a full recalculation" not in caplog.text
+    assert not game.simulate().completed
+
+def test_update_keeps_solver_of_last_run():
+    # update() falls back to a full run after a fixed-point run, it must stay in fixed-point mode
+    game = board([darkRow()])
+    game.simulate(solver="fixed")
+    game.layout[0][1] = game.layout[0][1].convert(other=models["mirror"], name="M")
+    updated = game.update((1, 0))
+    assert updated.iterations > 0
+    assert game.traces is None
+
+def test_update_matches_full_run(makeBoard, edits, edit, look):
+    # Every bundled level: after each rotation, flip, placement and removal, the incremental update
+    # must light the board exactly like a full run on a board that received the same edits
+    game, gameData = makeBoard()
+    reference, referenceData = makeBoard()
+    game.simulate()
+    for change in edits:
+        updated = game.update(edit(game, gameData, change))
+        edit(reference, referenceData, change)
+        full = reference.simulate()
+        assert look(game) == look(reference), change
+        assert updated.completed == full.completed, change
+
+class ray():
+    """skips[Dir] (then [y], then [x]) of an unindexed board: the entry is found by walking the layout at lookup time."""
+
+    def __init__(self, game, Dir:int, y:int|None=None):
+        self.game, self.Dir, self.y = game, Dir, y
+
+    def __getitem__(self, index:int):
+        if self.y is None:
+            return ray(self.game, self.Dir, index)
+        dx, dy = [0, -1, 0, 1][self.Dir], [-1, 0, 1, 0][self.Dir]
+        x, y, run = index + dx, self.y + dy, 0
+        while 0 <= x < self.game.width and 0 <= y < self.game.height:
+            if self.game.layout[y][x].code != kinds.empty:
+                return (x, y, run)
+            x, y, run = x + dx, y + dy, run + 1
+        return (None, None, run)
+
+class unindexed(board):
+    """Board with the ray-skip index disabled: no index is kept, every lookup walks the layout."""
+
+    def index(self, *positions:tuple[int, int]):
+        pass
+
+    @property
+    def skips(self):
+        return [ray(self, Dir) for Dir in range(4)]
+
+    @skips.setter
+    def skips(self, skips):
+        pass
+
+def test_skip_index_follows_edits(makeBoard, levelData, edits, edit, look):
+    # The index maintained through edits must equal a freshly built one,
+    # and tracing with it must light the board like walking the layout at every step
+    game, gameData = makeBoard()
+    reference = unindexed.fromLevel(copy.deepcopy(levelData))
+    referenceData = copy.deepcopy(levelData)
+    game.simulate()
+    for change in edits:
+        game.update(edit(game, gameData, change))
+        maintained = copy.deepcopy(game.skips)
+        game.index()
+        assert game.skips == maintained, change
+        edit(reference, referenceData, change)
+        reference.simulate()
+        assert look(game) == look(reference), change
+
+class recursive(board):
+    """Board following beams the way the engine did before the explicit stack: one recursive call per beam, cell by cell."""
+
+    def propagate(self, stack:list[tuple], visited:set, source:tuple[int, int]|None=None):
+        # The last front of the stack is followed first, the recursion takes them in list order reversed
+        for startX, startY, Dir, color in reversed(stack):
+            self.follow(startX, startY, Dir, color, visited, source)
+
+    def follow(self, startX:int, startY:int, Dir:int, color:tuple, visited:set, source:tuple[int, int]|None):
+        dx, dy = [0, -1, 0, 1][Dir], [-1, 0, 1, 0][Dir]
+        From = [2, 3, 0, 1][Dir]
+        x, y = startX + dx, startY + dy
+        while 0 <= x < self.width and 0 <= y < self.height:
+            newLights, rtrn = self.layout[y][x].changeLight(From=From, color=color)
+            visited.add((x, y))
+            self.record(x, y, From, color, source)
+            if self.layout[y][x].code != kinds.empty:
+                if not rtrn:
+                    for Dir, color in newLights.items():
+                        self.follow(x, y, Dir, color, visited, source)
+                return
+            x, y = x + dx, y + dy
+
+def test_stack_matches_recursion(makeBoard, levelData, edits, edit, look):
+    # Every bundled level, before and after each edit: the stack lights the same cells,
+    # with beams reaching every side in the same order, as the recursion it replaced
+    game, gameData = makeBoard()
+    reference = recursive.fromLevel(copy.deepcopy(levelData))
+    referenceData = copy.deepcopy(levelData)
+    for change in [None] + edits:
+        if change is not None:
+            edit(game, gameData, change)
+            edit(reference, referenceData, change)
+        result = game.simulate()
+        full = reference.simulate()
+        assert look(game) == look(reference), change
+        assert game.paths == reference.paths, change
+        assert game.traces == reference.traces, change
+        assert result.completed == full.completed, change
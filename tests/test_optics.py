@@ -0,0 +1,30 @@
+# Checks of the light models (engine.optics) against the per-channel maths they replaced
+import random
+import pytest
+from engine import rgb
+from engine.optics import models
+
+def channelBeam(color, opposite, potency:int, sign:int) -> tuple:
+    """Beam shown on a glass side before packed colors: color plus the opposite light moved by the potency where lit, clamped to 0-10."""
+    return tuple(max(0, min(10, color[i] + opposite[i] + sign * potency * int(bool(opposite[i])))) for i in range(3))
+
+def pairs() -> list:
+    """Every pair of channel values (on grey colors) and a random spread of mixed colors."""
+    rnd = random.Random(0)
+    grey = [((a, a, a), (b, b, b)) for a in range(rgb.levels) for b in range(rgb.levels)]
+    mixed = [(rgb.channels[rnd.randrange(rgb.size)], rgb.channels[rnd.randrange(rgb.size)]) for _ in range(600)]
+    return grey + mixed
+
+@pytest.mark.parametrize("kind", [0, 1])
+@pytest.mark.parametrize("potency", range(rgb.levels))
+def test_glass_beams_match_channel_maths(kind, potency):
+    # Light fed from the left, then from the right: both horizontal beams follow the per-channel formula
+    sign = -1 if kind == 1 else 1
+    for color, opposite in pairs():
+        glass = models["glass"](data={"direction": 0, "type": kind, "potency": potency})
+        glass.changeLight(3, opposite)
+        outputs, blocked = glass.changeLight(1, color)
+        beams = glass.visualState()[3]
+        assert rgb.channels[beams[1]] == channelBeam(color, opposite, potency, sign), (color, opposite)
+        assert rgb.channels[beams[3]] == channelBeam(opposite, color, potency, sign), (color, opposite)
+        assert outputs == {3: tuple(max(0, min(10, c + sign * potency * int(bool(c)))) for c in color)}
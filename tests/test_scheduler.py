@@ -0,0 +1,47 @@
+# Checks of the frame pacing of the game loops (scheduler.scheduler) with a headless display
+import os
+from time import perf_counter
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+import pytest
+from scheduler import scheduler
+
+@pytest.fixture(autouse=True)
+def display():
+    # The event queue needs the video system
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.event.clear()
+    yield
+    pygame.display.quit()
+
+def test_animating_caps_frame_rate():
+    # While animating, frames come at the target rate and carry no events when there is no input
+    frames = scheduler(fps=50)
+    frames.animating = True
+    frames.wait()
+    frames.done()
+    start = perf_counter()
+    for _ in range(10):
+        assert frames.wait() == []
+        frames.done()
+    elapsed = perf_counter() - start
+    assert 9 / 50 <= elapsed < 10 / 50 + 0.15
+
+def test_input_wakes_animating_wait():
+    # Input does not wait for the next animation frame
+    frames = scheduler(fps=2)
+    frames.animating = True
+    frames.wait()
+    frames.done()
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    start = perf_counter()
+    events = frames.wait()
+    assert perf_counter() - start < 0.1
+    assert [event.type for event in events] == [pygame.USEREVENT]
+
+def test_report_shows_target():
+    frames = scheduler(fps=30)
+    assert frames.stats()["fps"] == 30
+    assert "(target 30 fps)" in frames.report()
+    assert scheduler().stats()["fps"] == scheduler.fps
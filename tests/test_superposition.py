@@ -0,0 +1,113 @@
+# Checks of the superposed solver mode (engine.superposition through board(solver="superposed"))
+import copy
+import pytest
+from engine import board, models
+
+def beams(snapshot:dict) -> dict:
+    """Beams of every position of a snapshot (trace runs also mark blocks hit by dark beams, the other solvers do not)."""
+    return {position: state[3] for position, state in snapshot.items()}
+
+def state(game) -> tuple:
+    """Per-source bookkeeping of a superposed run: contributions, reached positions and beam paths."""
+    return copy.deepcopy((game.contributions, game.traces, game.paths))
+
+def ring(solver:str):
+    """
+    Laser firing into a prism, whose split light runs around a ring of mirrors
+    and comes back into the prism from two more sides.
+    """
+    empty = lambda: models["default"]()
+    layout = [[empty() for _ in range(5)] for _ in range(5)]
+    layout[2][0] = models["laser"](data={"direction": 3, "color": (6, 3, 0)})
+    layout[2][2] = models["prism"](data={"direction": 1})
+    layout[0][2] = models["mirror"](data={"direction": 1})
+    layout[0][4] = models["mirror"](data={"direction": 0})
+    layout[2][4] = models["mirror"](data={"direction": 1})
+    return board(layout, solver=solver)
+
+def test_matches_fixed_on_levels(makeBoard, look):
+    # Every bundled level lights up exactly like a fixed-point run
+    game, _ = makeBoard()
+    reference, _ = makeBoard()
+    superposed = game.simulate(solver="superposed")
+    fixed = reference.simulate(solver="fixed")
+    assert look(game) == look(reference)
+    assert superposed.completed == fixed.completed
+
+def test_single_sources_match_trace(makeBoard, look):
+    # A source alone has nothing to interact with: its light is the same as in a trace run
+    game, _ = makeBoard()
+    for source in game.sources():
+        reference, _ = makeBoard()
+        game.simulate([source], solver="superposed")
+        reference.simulate([source], solver="trace")
+        assert beams(look(game)) == beams(look(reference)), source
+        assert [cell.isCompleated for cell in game.finals()] == [cell.isCompleated for cell in reference.finals()], source
+
+@pytest.mark.parametrize("solver", ["trace", "fixed"])
+def test_loop_matches(solver, look):
+    # Light entering the prism again after a round of the ring is not traced forever and lights it like the other solvers
+    game, reference = ring("superposed"), ring(solver)
+    game.simulate()
+    reference.simulate()
+    entering = game.contributions[(0, 2)][(2, 2)]
+    assert sum(1 for color in entering if color) == 3
+    assert not game.exhausted
+    assert look(game) == look(reference)
+
+def test_loop_update_matches_full_run(look):
+    # Turning a ring mirror retraces the laser; a full run on a board with the same edit agrees
+    game, reference = ring("superposed"), ring("superposed")
+    game.simulate()
+    for cell in (game.layout[0][4], reference.layout[0][4]):
+        cell.changeDirection(1)
+    game.update((4, 0))
+    reference.simulate()
+    assert look(game) == look(reference)
+    assert state(game) == state(reference)
+
+def test_withdraw_and_contribute_restore(makeBoard):
+    # Taking a source's light away and tracing it again leaves the bookkeeping as it was
+    game, _ = makeBoard()
+    game.simulate(solver="superposed")
+    before = state(game)
+    for source in game.sources():
+        reached = game.withdraw(source)
+        assert source not in game.contributions
+        assert all(all(segment[0] != source for side in game.paths.get(position, ()) for segment in side) for position in reached)
+        game.contribute(source)
+        assert state(game) == before, source
+
+def undo(edit:tuple) -> list[tuple]:
+    """Edits taking an edit from the 'edits' fixture back (four rotations or two flips are a full turn)."""
+    action, position = edit[0], edit[1]
+    if action == "rotate":
+        return [edit] * 3
+    if action == "flip":
+        return [edit]
+    if action == "place":
+        return [("remove", position)]
+    # Removals only follow placements, they are undone by the fixture itself
+    return []
+
+def test_update_after_undo_restores(makeBoard, edits, edit, look):
+    # An edit withdraws and retraces the sources it touches, lighting the board like a full run;
+    # undoing it must bring back the same light and bookkeeping
+    game, gameData = makeBoard()
+    game.simulate(solver="superposed")
+    before, lookBefore = state(game), look(game)
+    for change in edits:
+        if change[0] == "remove":
+            continue
+        position = edit(game, gameData, change)
+        game.update(position)
+        reference, referenceData = makeBoard()
+        edit(reference, referenceData, change)
+        reference.simulate(solver="superposed")
+        assert look(game) == look(reference), change
+        assert state(game) == state(reference), change
+        for back in undo(change):
+            edit(game, gameData, back)
+        game.update(position)
+        assert look(game) == lookBefore, change
+        assert state(game) == before, change
@@ -0,0 +1,32 @@
+# Checks of the shared texture caches (cells.texturing) with a headless display
+import os
+from pathlib import Path
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+import pytest
+from cells import cells
+from cells.default import default
+from cells.texturing import tints
+from engine import scale
+
+@pytest.fixture(autouse=True)
+def display(monkeypatch):
+    # Textures are converted for the display and loaded relative to the repository root
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent)
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+def test_warmed_beam_render_hits_tint_cache():
+    # Warm the textures the beam renderer looks up, then light a cell horizontally and vertically
+    tints.clear()
+    tints.warm(default.beamVariants(), [scale.display((8, 4, 0))])
+    warmed = tints.stats()
+    cell = cells["default"]()
+    cell.changeBeamStates(beamDirs=[1], color=(8, 4, 0))
+    cell.changeBeamStates(vertical=True, beamDirs=[0], color=(8, 4, 0))
+    cell.render()
+    stats = tints.stats()
+    assert stats["misses"] == warmed["misses"]
+    assert stats["hits"] >= warmed["hits"] + 2